@@ -3,21 +3,50 @@ Streamlit web application for the multimodal video transcriber.
 Provides a user-friendly interface for testing the transcriber.
 """
 
-import os
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-import json
+from typing import TYPE_CHECKING, Optional
+import io
 import time
 from pathlib import Path
 
-from transcriber import VideoTranscriber
-from visualizer import TranscriptionVisualizer
-from config import Config
 from models import VideoTranscription
 
+if TYPE_CHECKING:
+    from transcriber import VideoTranscriber
+
+# Default text for the custom prompt editor
+DEFAULT_CUSTOM_PROMPT = """**Task 1 - Script Segments**
+
+- Watch the video and listen carefully to the audio.
+- Identify each unique voice using a `voice_id` (1, 2, 3, etc.).
+- Transcribe the video's audio verbatim with voice diarization.
+- Include the `start_time` and `end_time` timecodes (HH:MM:SS:FF) for each speech segment.
+- Output a JSON array where each object has the following fields:
+  - `start_time`
+  - `end_time`
+  - `text`
+  - `voice_id`
+
+**Task 2 - Speakers**
+
+- For each `voice_id` from Task 1, extract information about the corresponding speaker.
+- Use visual and audio cues.
+- If a piece of information cannot be found, use a question mark (`?`) as the value.
+- Output a JSON array where each object has the following fields:
+  - `voice_id`
+  - `name`
+  - `company`
+  - `position`
+  - `role_in_video`"""
+
+# Bounds for the caches keyed by transcription, so they don't grow with every video
+RESULT_CACHE_TTL = 24 * 60 * 60
+RESULT_CACHE_MAX_ENTRIES = 32
+
 # Page configuration
 st.set_page_config(
     page_title="Multimodal Video Transcriber",
@@ -26,8 +55,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+@st.cache_data(show_spinner=False)
+def get_custom_css() -> str:
+    """Get the custom CSS for better styling."""
+    return """
 <style>
     .main-header {
         font-size: 3rem;
@@ -63,7 +94,325 @@ st.markdown("""
         margin: 1rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Custom CSS for better styling
+st.markdown(get_custom_css(), unsafe_allow_html=True)
+
+@st.cache_resource(show_spinner=False)
+def get_transcriber(use_vertex_ai: bool, project_id: str, location: str, api_key: str) -> "VideoTranscriber":
+    """Get a transcriber for the given credentials, reused across reruns."""
+    # Imported lazily since the Gen AI SDK is slow to load on a cold start
+    from transcriber import VideoTranscriber
+    
+    # Credentials are passed explicitly since the environment is shared by every session
+    return VideoTranscriber(
+        skip_config_validation=True,
+        use_vertex_ai=use_vertex_ai,
+        project_id=project_id,
+        location=location,
+        api_key=api_key,
+    )
+
+@st.cache_resource(show_spinner=False)
+def get_executor() -> ThreadPoolExecutor:
+    """Get the shared executor that runs transcriptions off the script thread."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="transcribe")
+
+@st.cache_data(ttl=RESULT_CACHE_TTL, max_entries=RESULT_CACHE_MAX_ENTRIES, show_spinner=False)
+def run_transcription(
+    _transcriber: "VideoTranscriber",
+    use_vertex_ai: bool,
+    project_id: str,
+    video_uri: str,
+    start_seconds: Optional[float],
+    end_seconds: Optional[float],
+    fps: float,
+    model: str,
+    custom_prompt: Optional[str],
+) -> dict:
+    """Transcribe a video, memoizing the result for repeated submissions."""
+    # The backend is part of the key since each one accepts different video sources;
+    # offsets are passed as seconds so the arguments stay hashable
+    transcription = _transcriber.transcribe_video(
+        video_uri=video_uri,
+        start_offset=timedelta(seconds=start_seconds) if start_seconds is not None else None,
+        end_offset=timedelta(seconds=end_seconds) if end_seconds is not None else None,
+        fps=fps,
+        model=model,
+        custom_prompt=custom_prompt,
+    )
+    if not transcription.script_segments:
+        # Raised rather than returned so an empty result is never cached
+        raise ValueError("No transcription segments returned - check that the selected API supports this video source")
+    return transcription.model_dump()
+
+@st.cache_data(ttl=RESULT_CACHE_TTL, max_entries=RESULT_CACHE_MAX_ENTRIES, show_spinner=False)
+def compute_analytics(transcription: VideoTranscription) -> dict:
+    """Aggregate emotion, tone, energy and timeline data in a single pass."""
+    emotion_counts, tone_counts, energy_counts = Counter(), Counter(), Counter()
+    voice_counts = Counter()
+    has_emotion = has_tone = has_energy = False
+    starts, ends, voice_ids, texts = [], [], [], []
+    
+    for segment in transcription.script_segments:
+        if segment.emotion:
+            emotion_counts[segment.emotion] += 1
+            has_emotion = True
+        if segment.tone:
+            tone_counts[segment.tone] += 1
+            has_tone = True
+        if segment.energy_level:
+            energy_counts[segment.energy_level] += 1
+            has_energy = True
+        voice_counts[segment.voice_id] += 1
+        
+        starts.append(segment.start_time)
+        ends.append(segment.end_time)
+        voice_ids.append(segment.voice_id)
+        texts.append(segment.text)
+    
+    # Build the timeline column-wise so speaker lookup and truncation are vectorized
+    timeline_df = pd.DataFrame({"Start": starts, "End": ends, "voice_id": voice_ids, "Text": texts})
+    name_by_vid = {sp.voice_id: sp.name for sp in transcription.speakers}
+    timeline_df["Speaker"] = timeline_df["voice_id"].map(name_by_vid).fillna(
+        "Voice " + timeline_df["voice_id"].astype(str)
+    )
+    long_text = timeline_df["Text"].str.len() > 50
+    timeline_df.loc[long_text, "Text"] = timeline_df.loc[long_text, "Text"].str.slice(0, 50) + "..."
+    
+    return {
+        "has_emotion": has_emotion,
+        "has_tone": has_tone,
+        "has_energy": has_energy,
+        "emotion": emotion_counts,
+        "tone": tone_counts,
+        "energy": energy_counts,
+        "voice": voice_counts,
+        "timeline": timeline_df,
+    }
+
+@st.cache_data(show_spinner=False)
+def get_about_markdown() -> str:
+    """Get the body of the About tab."""
+    return """
+        ## 🎬 Multimodal Video Transcriber
+        
+        This application uses Google's Gemini AI model to transcribe videos with detailed speaker identification.
+        
+        ### ✨ Features
+        - **Multimodal Processing**: Combines audio and visual cues
+        - **Speaker Diarization**: Identifies and tracks different speakers
+        - **Speaker Information**: Extracts names, companies, positions, and roles
+        - **Emotion & Tonality Detection**: Analyzes emotion, tone, energy level, and speech rate for AI dubbing
+        - **Multiple Input Sources**: YouTube, Cloud Storage, direct URLs
+        - **Export Options**: JSON and CSV formats
+        - **Multilingual Support**: Works with 100+ languages
+        
+        ### 🤖 Models
+        - **Gemini 2.0 Flash**: Fast, cost-effective for standard videos
+        - **Gemini 2.5 Flash**: Balanced performance for longer videos
+        - **Gemini 2.5 Pro**: High-quality for complex content
+        
+        ### 📊 Output Format
+        The transcriber produces structured data with:
+        - **Script Segments**: Timecoded transcription with speaker identification, emotion, tone, energy, and speech rate
+        - **Speakers**: Detailed speaker information
+        - **Translation Table**: Optional multilingual support
+        - **AI Dubbing Data**: Emotion, tone, energy level, and speech rate for voice synthesis
+        
+        ### 🔧 Configuration
+        - **Google AI Studio**: Free tier for testing (requires API key)
+        - **Vertex AI**: Enterprise-grade (requires Google Cloud project)
+        
+        ### 📚 Resources
+        - [Towards Data Science Article](https://towardsdatascience.com/unlocking-multimodal-video-transcription-with-gemini/)
+        - [Google Gen AI Documentation](https://cloud.google.com/vertex-ai/generative-ai/docs)
+        - [Original Notebook](https://github.com/GoogleCloudPlatform/generative-ai/blob/main/gemini/use-cases/video-analysis/multimodal_video_transcription.ipynb)
+        
+        ### 🚀 Deployment
+        This app can be deployed to:
+        - **Render**: Free tier available
+        - **Railway**: Easy deployment
+        - **Streamlit Cloud**: Native Streamlit hosting
+        """
+
+@st.cache_data(ttl=RESULT_CACHE_TTL, max_entries=RESULT_CACHE_MAX_ENTRIES, show_spinner=False)
+def get_raw_json(transcription: VideoTranscription) -> str:
+    """Serialize the transcription for the raw JSON view."""
+    return transcription.model_dump_json(indent=2)
+
+@st.fragment
+def render_results(transcription: VideoTranscription) -> None:
+    """Render the Results tab, rerunning only when its own inputs change."""
+    # Summary metrics
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Script Segments", transcription.total_segments)
+    with col2:
+        st.metric("Speakers", transcription.total_speakers)
+    with col3:
+        st.metric("Language", transcription.language_detected or "Unknown")
+    with col4:
+        st.metric("Duration", transcription.video_duration or "Unknown")
+    
+    # Speakers table
+    st.subheader("👥 Speakers")
+    if transcription.speakers:
+        speakers_data = []
+        for speaker in transcription.speakers:
+            speakers_data.append({
+                "Voice ID": speaker.voice_id,
+                "Name": speaker.name,
+                "Company": speaker.company,
+                "Position": speaker.position,
+                "Role": speaker.role_in_video
+            })
+        
+        speakers_df = pd.DataFrame(speakers_data)
+        st.dataframe(speakers_df, use_container_width=True)
+    else:
+        st.info("No speakers identified.")
+    
+    # Script segments table
+    st.subheader("📝 Script Segments")
+    if transcription.script_segments:
+        segments_data = []
+        for segment in transcription.script_segments:
+            speaker = transcription.speaker_by_voice_id.get(segment.voice_id)
+            segments_data.append({
+                "Start Time": segment.start_time,
+                "End Time": segment.end_time,
+                "Speaker": speaker.name if speaker else f"Voice {segment.voice_id}",
+                "Emotion": segment.emotion or "-",
+                "Tone": segment.tone or "-",
+                "Energy": segment.energy_level or "-",
+                "Rate": segment.speech_rate or "-",
+                "Text": segment.text,
+                "Voice ID": segment.voice_id
+            })
+        
+        segments_df = pd.DataFrame(segments_data)
+        st.dataframe(segments_df, use_container_width=True)
+    else:
+        st.info("No script segments found.")
+    
+    # Raw JSON view
+    with st.expander("🔍 Raw JSON Data"):
+        st.code(get_raw_json(transcription), language="json")
+
+@st.cache_data(ttl=RESULT_CACHE_TTL, max_entries=RESULT_CACHE_MAX_ENTRIES, show_spinner=False)
+def build_analytics_figures(transcription: VideoTranscription) -> dict:
+    """Build the Analytics tab figures, memoized on the transcription content."""
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
+    analytics = compute_analytics(transcription)
+    figures = {}
+    
+    # Emotion distribution
+    if analytics["has_emotion"]:
+        emotion_counts = analytics["emotion"]
+        figures["emotion"] = px.pie(
+            names=list(emotion_counts.keys()),
+            values=list(emotion_counts.values()),
+            title="Emotion Distribution",
+            color_discrete_sequence=px.colors.qualitative.Pastel
+        )
+    
+    # Tone distribution
+    if analytics["has_tone"]:
+        tones, counts = zip(*analytics["tone"].most_common())
+        fig = px.bar(
+            x=list(tones),
+            y=list(counts),
+            title="Tone Distribution",
+            color_discrete_sequence=px.colors.qualitative.Set3
+        )
+        fig.update_layout(xaxis_title="Tone", yaxis_title="Count")
+        figures["tone"] = fig
+    
+    # Energy level distribution
+    if analytics["has_energy"]:
+        energies, counts = zip(*analytics["energy"].most_common())
+        fig = px.bar(
+            x=list(energies),
+            y=list(counts),
+            title="Energy Level Distribution",
+            color_discrete_sequence=px.colors.sequential.Viridis
+        )
+        fig.update_layout(xaxis_title="Energy Level", yaxis_title="Count")
+        figures["energy"] = fig
+    
+    # Speaker distribution
+    if transcription.speakers:
+        speaker_names = [sp.name if sp.name != "?" else f"Voice {sp.voice_id}" for sp in transcription.speakers]
+        speaker_counts = [analytics["voice"].get(sp.voice_id, 0) for sp in transcription.speakers]
+        
+        figures["speaker"] = px.pie(
+            values=speaker_counts,
+            names=speaker_names,
+            title="Script Segments by Speaker"
+        )
+    
+    # Timeline visualization
+    if transcription.script_segments:
+        timeline_df = analytics["timeline"]
+        
+        # Create timeline chart
+        fig = go.Figure()
+        
+        colors = px.colors.qualitative.Set3
+        for i, speaker in enumerate(timeline_df['Speaker'].unique()):
+            speaker_data = timeline_df[timeline_df['Speaker'] == speaker]
+            
+            fig.add_trace(go.Scatter(
+                x=[speaker_data['Start'].iloc[0], speaker_data['End'].iloc[-1]],
+                y=[speaker] * 2,
+                mode='lines+markers',
+                name=speaker,
+                line=dict(color=colors[i % len(colors)], width=8),
+                hovertemplate='<b>%{y}</b><br>Time: %{x}<extra></extra>'
+            ))
+        
+        fig.update_layout(
+            title="Speaker Timeline",
+            xaxis_title="Time",
+            yaxis_title="Speaker",
+            height=400
+        )
+        figures["timeline"] = fig
+    
+    return figures
+
+@st.fragment
+def render_analytics(transcription: VideoTranscription) -> None:
+    """Render the Analytics tab, rerunning only when its own inputs change."""
+    if not transcription.script_segments:
+        st.info("No data available for analytics.")
+        return
+    
+    figures = build_analytics_figures(transcription)
+    
+    if "emotion" in figures:
+        st.subheader("📊 Emotion Distribution")
+        st.plotly_chart(figures["emotion"], use_container_width=True)
+    
+    if "tone" in figures:
+        st.subheader("🎭 Tone Distribution")
+        st.plotly_chart(figures["tone"], use_container_width=True)
+    
+    if "energy" in figures:
+        st.subheader("⚡ Energy Level Distribution")
+        st.plotly_chart(figures["energy"], use_container_width=True)
+    
+    st.subheader("👥 Speaker Distribution")
+    if "speaker" in figures:
+        st.plotly_chart(figures["speaker"], use_container_width=True)
+    
+    st.subheader("Timeline")
+    if "timeline" in figures:
+        st.plotly_chart(figures["timeline"], use_container_width=True)
 
 def main():
     """Main application function."""
@@ -72,6 +421,10 @@ def main():
     st.markdown('<h1 class="main-header">🎬 Multimodal Video Transcriber</h1>', unsafe_allow_html=True)
     st.markdown('<p class="sub-header">Powered by Google Gemini AI</p>', unsafe_allow_html=True)
     
+    # Persist credentials across reruns, even while their widgets are hidden
+    for key, default in (("api_key", ""), ("project_id", ""), ("location", "global")):
+        st.session_state[key] = st.session_state.get(key, default)
+    
     # Sidebar configuration
     with st.sidebar:
         st.header("⚙️ Configuration")
@@ -81,22 +434,19 @@ def main():
         use_vertex_ai = st.checkbox("Use Vertex AI (instead of Google AI Studio)", value=False)
         
         if use_vertex_ai:
-            project_id = st.text_input("Google Cloud Project ID", placeholder="your-project-id")
-            location = st.text_input("Location", value="global", placeholder="global")
-            
-            if st.button("Set Vertex AI Config"):
-                st.session_state.vertex_ai_config = {
-                    "use_vertex_ai": True,
-                    "project_id": project_id,
-                    "location": location
-                }
-                st.success("Vertex AI configuration set!")
+            st.text_input("Google Cloud Project ID", placeholder="your-project-id", key="project_id")
+            st.text_input("Location", placeholder="global", key="location")
         else:
-            api_key = st.text_input("Google AI Studio API Key", type="password", placeholder="your-api-key")
-            
-            if st.button("Set API Key"):
-                st.session_state.api_key = api_key
-                st.success("API key set!")
+            st.text_input("Google AI Studio API Key", type="password", placeholder="your-api-key", key="api_key")
+        
+        if use_vertex_ai and st.session_state.project_id:
+            st.session_state.vertex_ai_config = {
+                "use_vertex_ai": True,
+                "project_id": st.session_state.project_id,
+                "location": st.session_state.location
+            }
+        else:
+            st.session_state.vertex_ai_config = None
         
         # Model Configuration
         st.subheader("Model Settings")
@@ -136,410 +486,171 @@ def main():
             horizontal=True
         )
         
-        # Input field based on selection
-        video_input = ""
-        if input_method == "YouTube Video ID":
-            video_input = st.text_input("YouTube Video ID", placeholder="0pJn3g8dfwk")
-        elif input_method == "YouTube URL":
-            video_input = st.text_input("YouTube URL", placeholder="https://www.youtube.com/watch?v=0pJn3g8dfwk")
-        elif input_method == "Direct Video URL":
-            video_input = st.text_input("Video URL", placeholder="https://example.com/video.mp4")
-        elif input_method == "Google Cloud Storage URI":
-            video_input = st.text_input("GCS URI", placeholder="gs://bucket/path/to/video.mp4")
-        
         # Custom prompt option
         use_custom_prompt = st.checkbox("Use custom prompt", value=False)
-        custom_prompt = ""
-        if use_custom_prompt:
-            custom_prompt = st.text_area(
-                "Custom Prompt",
-                value="""**Task 1 - Script Segments**
-
-- Watch the video and listen carefully to the audio.
-- Identify each unique voice using a `voice_id` (1, 2, 3, etc.).
-- Transcribe the video's audio verbatim with voice diarization.
-- Include the `start_time` and `end_time` timecodes (HH:MM:SS:FF) for each speech segment.
-- Output a JSON array where each object has the following fields:
-  - `start_time`
-  - `end_time`
-  - `text`
-  - `voice_id`
-
-**Task 2 - Speakers**
-
-- For each `voice_id` from Task 1, extract information about the corresponding speaker.
-- Use visual and audio cues.
-- If a piece of information cannot be found, use a question mark (`?`) as the value.
-- Output a JSON array where each object has the following fields:
-  - `voice_id`
-  - `name`
-  - `company`
-  - `position`
-  - `role_in_video`""",
-                height=300
-            )
         
-        # Transcribe button
-        if st.button("🚀 Start Transcription", type="primary", use_container_width=True):
-            if not video_input:
-                st.error("Please enter a video source!")
-                return
-            
-            # Check configuration
-            if not st.session_state.get('api_key') and not st.session_state.get('vertex_ai_config'):
-                st.error("Please configure your API credentials in the sidebar!")
-                return
-            
-            # Prepare video URI
-            video_uri = video_input
+        # Batch the text inputs into a single rerun on submit
+        with st.form("transcribe", clear_on_submit=False):
+            # Input field based on selection
+            video_input = ""
             if input_method == "YouTube Video ID":
-                video_uri = f"https://www.youtube.com/watch?v={video_input}"
-            
-            # Prepare time offsets
-            start_offset = None
-            end_offset = None
-            if enable_segments:
-                start_offset = timedelta(minutes=start_minutes, seconds=start_seconds)
-                end_offset = timedelta(minutes=end_minutes, seconds=end_seconds)
-            
-            # Progress bar
-            progress_bar = st.progress(0)
-            status_text = st.empty()
+                video_input = st.text_input("YouTube Video ID", placeholder="0pJn3g8dfwk")
+            elif input_method == "YouTube URL":
+                video_input = st.text_input("YouTube URL", placeholder="https://www.youtube.com/watch?v=0pJn3g8dfwk")
+            elif input_method == "Direct Video URL":
+                video_input = st.text_input("Video URL", placeholder="https://example.com/video.mp4")
+            elif input_method == "Google Cloud Storage URI":
+                video_input = st.text_input("GCS URI", placeholder="gs://bucket/path/to/video.mp4")
             
-            try:
-                # Set configuration
-                if st.session_state.get('vertex_ai_config'):
-                    config = st.session_state.vertex_ai_config
-                    os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "True"
-                    os.environ["GOOGLE_CLOUD_PROJECT"] = config["project_id"]
-                    os.environ["GOOGLE_CLOUD_LOCATION"] = config["location"]
-                else:
-                    os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "False"
-                    os.environ["GOOGLE_API_KEY"] = st.session_state.api_key
-                
-                status_text.text("Initializing transcriber...")
-                progress_bar.progress(10)
-                
-                # Initialize transcriber with config validation skipped since we set env vars in the UI
-                transcriber = VideoTranscriber(skip_config_validation=True)
-                status_text.text("Processing video...")
-                progress_bar.progress(30)
-                
-                # Transcribe
-                transcription = transcriber.transcribe_video(
-                    video_uri=video_uri,
-                    start_offset=start_offset,
-                    end_offset=end_offset,
-                    fps=fps,
-                    model=model,
-                    custom_prompt=custom_prompt if use_custom_prompt else None
+            custom_prompt = ""
+            if use_custom_prompt:
+                custom_prompt = st.text_area(
+                    "Custom Prompt",
+                    value=DEFAULT_CUSTOM_PROMPT,
+                    height=300
                 )
+            
+            # Transcribe button
+            submitted = st.form_submit_button("🚀 Start Transcription", type="primary", use_container_width=True)
+        
+        if submitted:
+            if not video_input:
+                st.error("Please enter a video source!")
+            elif not st.session_state.get('api_key') and not st.session_state.get('vertex_ai_config'):
+                st.error("Please configure your API credentials in the sidebar!")
+            else:
+                # Prepare video URI
+                video_uri = video_input
+                if input_method == "YouTube Video ID":
+                    video_uri = f"https://www.youtube.com/watch?v={video_input}"
                 
-                progress_bar.progress(90)
-                status_text.text("Finalizing results...")
-                
-                # Store results in session state
-                st.session_state.transcription = transcription
-                st.session_state.video_uri = video_uri
+                # Prepare time offsets
+                start_offset = None
+                end_offset = None
+                if enable_segments:
+                    start_offset = timedelta(minutes=start_minutes, seconds=start_seconds)
+                    end_offset = timedelta(minutes=end_minutes, seconds=end_seconds)
                 
-                progress_bar.progress(100)
-                status_text.text("Transcription completed!")
+                # Progress bar
+                progress_bar = st.progress(0)
+                status_text = st.empty()
                 
-                # Export if requested
-                if export_json or export_csv:
-                    timestamp = int(time.time())
-                    base_filename = f"transcription_{timestamp}"
+                try:
+                    status_text.text("Initializing transcriber...")
+                    progress_bar.progress(10)
                     
-                    if export_json:
-                        json_data = transcription.model_dump()
-                        st.download_button(
-                            label="📥 Download JSON",
-                            data=json.dumps(json_data, indent=2),
-                            file_name=f"{base_filename}.json",
-                            mime="application/json"
-                        )
+                    # Reuse the cached transcriber for the configured credentials
+                    config = st.session_state.get('vertex_ai_config')
+                    use_vertex_ai = bool(config)
+                    project_id = config["project_id"] if use_vertex_ai else ""
+                    if use_vertex_ai:
+                        transcriber = get_transcriber(True, project_id, config["location"], "")
+                    else:
+                        transcriber = get_transcriber(False, "", "", st.session_state.api_key)
+                    status_text.text("Processing video...")
+                    progress_bar.progress(30)
                     
-                    if export_csv:
-                        # Create CSV data
-                        segments_df = pd.DataFrame([
-                            {
-                                "start_time": seg.start_time,
-                                "end_time": seg.end_time,
-                                "text": seg.text,
-                                "voice_id": seg.voice_id,
-                                "emotion": seg.emotion or "",
-                                "tone": seg.tone or "",
-                                "energy_level": seg.energy_level or "",
-                                "speech_rate": seg.speech_rate or ""
-                            } for seg in transcription.script_segments
-                        ])
-                        
-                        speakers_df = pd.DataFrame([
-                            {
-                                "voice_id": sp.voice_id,
-                                "name": sp.name,
-                                "company": sp.company,
-                                "position": sp.position,
-                                "role_in_video": sp.role_in_video
-                            } for sp in transcription.speakers
-                        ])
-                        
-                        # Combine into one CSV
-                        combined_data = []
-                        for seg in transcription.script_segments:
-                            speaker = transcription.get_speaker_by_voice_id(seg.voice_id)
-                            combined_data.append({
-                                "start_time": seg.start_time,
-                                "end_time": seg.end_time,
-                                "speaker_name": speaker.name if speaker else "?",
-                                "speaker_company": speaker.company if speaker else "?",
-                                "speaker_position": speaker.position if speaker else "?",
-                                "text": seg.text,
-                                "voice_id": seg.voice_id,
-                                "emotion": seg.emotion or "",
-                                "tone": seg.tone or "",
-                                "energy_level": seg.energy_level or "",
-                                "speech_rate": seg.speech_rate or ""
-                            })
+                    # Transcribe in the background so the progress bar keeps updating
+                    future = get_executor().submit(
+                        run_transcription,
+                        transcriber,
+                        use_vertex_ai=use_vertex_ai,
+                        project_id=project_id,
+                        video_uri=video_uri,
+                        start_seconds=start_offset.total_seconds() if start_offset else None,
+                        end_seconds=end_offset.total_seconds() if end_offset else None,
+                        fps=fps,
+                        model=model,
+                        custom_prompt=custom_prompt if use_custom_prompt else None
+                    )
+                    progress = 30
+                    while not future.done():
+                        progress = min(90, progress + 1)
+                        progress_bar.progress(progress)
+                        time.sleep(0.5)
+                    transcription = VideoTranscription.model_validate(future.result())
+                    
+                    progress_bar.progress(90)
+                    status_text.text("Finalizing results...")
+                    
+                    # Store results in session state
+                    st.session_state.transcription = transcription
+                    st.session_state.video_uri = video_uri
+                    
+                    progress_bar.progress(100)
+                    status_text.text("Transcription completed!")
+                    
+                    # Export if requested
+                    if export_json or export_csv:
+                        timestamp = int(time.time())
+                        base_filename = f"transcription_{timestamp}"
                         
-                        combined_df = pd.DataFrame(combined_data)
-                        csv_data = combined_df.to_csv(index=False)
+                        if export_json:
+                            # Shares the cached serialization with the Results tab's raw JSON view
+                            st.download_button(
+                                label="📥 Download JSON",
+                                data=get_raw_json(transcription),
+                                file_name=f"{base_filename}.json",
+                                mime="application/json"
+                            )
                         
-                        st.download_button(
-                            label="📥 Download CSV",
-                            data=csv_data,
-                            file_name=f"{base_filename}.csv",
-                            mime="text/csv"
-                        )
-                
-                st.success("✅ Transcription completed successfully!")
-                
-            except Exception as e:
-                st.error(f"Error during transcription: {str(e)}")
-                progress_bar.empty()
-                status_text.empty()
-    
+                        if export_csv:
+                            # Combine segments with their speaker info into one CSV
+                            combined_data = []
+                            for seg in transcription.script_segments:
+                                speaker = transcription.speaker_by_voice_id.get(seg.voice_id)
+                                combined_data.append({
+                                    "start_time": seg.start_time,
+                                    "end_time": seg.end_time,
+                                    "speaker_name": speaker.name if speaker else "?",
+                                    "speaker_company": speaker.company if speaker else "?",
+                                    "speaker_position": speaker.position if speaker else "?",
+                                    "text": seg.text,
+                                    "voice_id": seg.voice_id,
+                                    "emotion": seg.emotion or "",
+                                    "tone": seg.tone or "",
+                                    "energy_level": seg.energy_level or "",
+                                    "speech_rate": seg.speech_rate or ""
+                                })
+                            
+                            combined_df = pd.DataFrame(combined_data)
+                            csv_buffer = io.BytesIO()
+                            combined_df.to_csv(csv_buffer, index=False)
+                            
+                            st.download_button(
+                                label="📥 Download CSV",
+                                data=csv_buffer,
+                                file_name=f"{base_filename}.csv",
+                                mime="text/csv"
+                            )
+                    
+                    st.success("✅ Transcription completed successfully!")
+                    
+                except Exception as e:
+                    st.error(f"Error during transcription: {str(e)}")
+                    progress_bar.empty()
+                    status_text.empty()
+        
     with tab2:
         st.header("Transcription Results")
         
         if 'transcription' not in st.session_state:
             st.info("No transcription results available. Please run a transcription first.")
-            return
-        
-        transcription = st.session_state.transcription
-        
-        # Summary metrics
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Script Segments", transcription.total_segments)
-        with col2:
-            st.metric("Speakers", transcription.total_speakers)
-        with col3:
-            st.metric("Language", transcription.language_detected or "Unknown")
-        with col4:
-            st.metric("Duration", transcription.video_duration or "Unknown")
-        
-        # Speakers table
-        st.subheader("👥 Speakers")
-        if transcription.speakers:
-            speakers_data = []
-            for speaker in transcription.speakers:
-                speakers_data.append({
-                    "Voice ID": speaker.voice_id,
-                    "Name": speaker.name,
-                    "Company": speaker.company,
-                    "Position": speaker.position,
-                    "Role": speaker.role_in_video
-                })
-            
-            speakers_df = pd.DataFrame(speakers_data)
-            st.dataframe(speakers_df, use_container_width=True)
-        else:
-            st.info("No speakers identified.")
-        
-        # Script segments table
-        st.subheader("📝 Script Segments")
-        if transcription.script_segments:
-            segments_data = []
-            for segment in transcription.script_segments:
-                speaker = transcription.get_speaker_by_voice_id(segment.voice_id)
-                segments_data.append({
-                    "Start Time": segment.start_time,
-                    "End Time": segment.end_time,
-                    "Speaker": speaker.name if speaker else f"Voice {segment.voice_id}",
-                    "Emotion": segment.emotion or "-",
-                    "Tone": segment.tone or "-",
-                    "Energy": segment.energy_level or "-",
-                    "Rate": segment.speech_rate or "-",
-                    "Text": segment.text,
-                    "Voice ID": segment.voice_id
-                })
-            
-            segments_df = pd.DataFrame(segments_data)
-            st.dataframe(segments_df, use_container_width=True)
         else:
-            st.info("No script segments found.")
-        
-        # Raw JSON view
-        with st.expander("🔍 Raw JSON Data"):
-            st.json(transcription.model_dump())
+            render_results(st.session_state.transcription)
     
     with tab3:
         st.header("Analytics")
         
         if 'transcription' not in st.session_state:
             st.info("No transcription results available. Please run a transcription first.")
-            return
-        
-        transcription = st.session_state.transcription
-        
-        if not transcription.script_segments:
-            st.info("No data available for analytics.")
-            return
-        
-        # Emotion distribution
-        if transcription.script_segments and any(seg.emotion for seg in transcription.script_segments):
-            st.subheader("📊 Emotion Distribution")
-            emotion_data = [{"emotion": seg.emotion} for seg in transcription.script_segments if seg.emotion]
-            if emotion_data:
-                emotion_df = pd.DataFrame(emotion_data)
-                fig = px.pie(
-                    emotion_df,
-                    names="emotion",
-                    title="Emotion Distribution",
-                    color_discrete_sequence=px.colors.qualitative.Pastel
-                )
-                st.plotly_chart(fig, use_container_width=True)
-        
-        # Tone distribution
-        if transcription.script_segments and any(seg.tone for seg in transcription.script_segments):
-            st.subheader("🎭 Tone Distribution")
-            tone_data = [{"tone": seg.tone} for seg in transcription.script_segments if seg.tone]
-            if tone_data:
-                tone_df = pd.DataFrame(tone_data)
-                fig = px.bar(
-                    tone_df["tone"].value_counts(),
-                    title="Tone Distribution",
-                    color_discrete_sequence=px.colors.qualitative.Set3
-                )
-                fig.update_layout(xaxis_title="Tone", yaxis_title="Count")
-                st.plotly_chart(fig, use_container_width=True)
-        
-        # Energy level distribution
-        if transcription.script_segments and any(seg.energy_level for seg in transcription.script_segments):
-            st.subheader("⚡ Energy Level Distribution")
-            energy_data = [{"energy": seg.energy_level} for seg in transcription.script_segments if seg.energy_level]
-            if energy_data:
-                energy_df = pd.DataFrame(energy_data)
-                fig = px.bar(
-                    energy_df["energy"].value_counts(),
-                    title="Energy Level Distribution",
-                    color_discrete_sequence=px.colors.sequential.Viridis
-                )
-                fig.update_layout(xaxis_title="Energy Level", yaxis_title="Count")
-                st.plotly_chart(fig, use_container_width=True)
-        
-        # Speaker distribution
-        st.subheader("👥 Speaker Distribution")
-        if transcription.speakers:
-            speaker_names = [sp.name if sp.name != "?" else f"Voice {sp.voice_id}" for sp in transcription.speakers]
-            speaker_counts = []
-            
-            for speaker in transcription.speakers:
-                segments = transcription.get_segments_by_speaker(speaker.name) if speaker.name != "?" else []
-                speaker_counts.append(len(segments))
-            
-            fig = px.pie(
-                values=speaker_counts,
-                names=speaker_names,
-                title="Script Segments by Speaker"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Timeline visualization
-        st.subheader("Timeline")
-        if transcription.script_segments:
-            timeline_data = []
-            for segment in transcription.script_segments:
-                speaker = transcription.get_speaker_by_voice_id(segment.voice_id)
-                timeline_data.append({
-                    "Start": segment.start_time,
-                    "End": segment.end_time,
-                    "Speaker": speaker.name if speaker else f"Voice {segment.voice_id}",
-                    "Text": segment.text[:50] + "..." if len(segment.text) > 50 else segment.text
-                })
-            
-            timeline_df = pd.DataFrame(timeline_data)
-            
-            # Create timeline chart
-            fig = go.Figure()
-            
-            colors = px.colors.qualitative.Set3
-            for i, speaker in enumerate(timeline_df['Speaker'].unique()):
-                speaker_data = timeline_df[timeline_df['Speaker'] == speaker]
-                
-                fig.add_trace(go.Scatter(
-                    x=[speaker_data['Start'].iloc[0], speaker_data['End'].iloc[-1]],
-                    y=[speaker] * 2,
-                    mode='lines+markers',
-                    name=speaker,
-                    line=dict(color=colors[i % len(colors)], width=8),
-                    hovertemplate='<b>%{y}</b><br>Time: %{x}<extra></extra>'
-                ))
-            
-            fig.update_layout(
-                title="Speaker Timeline",
-                xaxis_title="Time",
-                yaxis_title="Speaker",
-                height=400
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+        else:
+            render_analytics(st.session_state.transcription)
     
     with tab4:
         st.header("About")
         
-        st.markdown("""
-        ## 🎬 Multimodal Video Transcriber
-        
-        This application uses Google's Gemini AI model to transcribe videos with detailed speaker identification.
-        
-        ### ✨ Features
-        - **Multimodal Processing**: Combines audio and visual cues
-        - **Speaker Diarization**: Identifies and tracks different speakers
-        - **Speaker Information**: Extracts names, companies, positions, and roles
-        - **Emotion & Tonality Detection**: Analyzes emotion, tone, energy level, and speech rate for AI dubbing
-        - **Multiple Input Sources**: YouTube, Cloud Storage, direct URLs
-        - **Export Options**: JSON and CSV formats
-        - **Multilingual Support**: Works with 100+ languages
-        
-        ### 🤖 Models
-        - **Gemini 2.0 Flash**: Fast, cost-effective for standard videos
-        - **Gemini 2.5 Flash**: Balanced performance for longer videos
-        - **Gemini 2.5 Pro**: High-quality for complex content
-        
-        ### 📊 Output Format
-        The transcriber produces structured data with:
-        - **Script Segments**: Timecoded transcription with speaker identification, emotion, tone, energy, and speech rate
-        - **Speakers**: Detailed speaker information
-        - **Translation Table**: Optional multilingual support
-        - **AI Dubbing Data**: Emotion, tone, energy level, and speech rate for voice synthesis
-        
-        ### 🔧 Configuration
-        - **Google AI Studio**: Free tier for testing (requires API key)
-        - **Vertex AI**: Enterprise-grade (requires Google Cloud project)
-        
-        ### 📚 Resources
-        - [Towards Data Science Article](https://towardsdatascience.com/unlocking-multimodal-video-transcription-with-gemini/)
-        - [Google Gen AI Documentation](https://cloud.google.com/vertex-ai/generative-ai/docs)
-        - [Original Notebook](https://github.com/GoogleCloudPlatform/generative-ai/blob/main/gemini/use-cases/video-analysis/multimodal_video_transcription.ipynb)
-        
-        ### 🚀 Deployment
-        This app can be deployed to:
-        - **Render**: Free tier available
-        - **Railway**: Easy deployment
-        - **Streamlit Cloud**: Native Streamlit hosting
-        """)
+        st.markdown(get_about_markdown())
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Batch transcription of many YouTube videos across processes.
+Runs under MPI when launched with mpirun and mpi4py is installed, otherwise uses a local process pool.
+"""
+
+import argparse
+import multiprocessing
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from config import Config
+from models import VideoTranscription
+from rate_limiter import get_rate_limiter
+from transcriber import VideoTranscriber
+from visualizer import TranscriptionVisualizer
+
+try:
+    from mpi4py import MPI
+except ImportError:
+    MPI = None
+
+# Per-process transcriber (the Gemini client is not fork-safe, so each worker builds its own)
+_transcriber: Optional[VideoTranscriber] = None
+
+def _init_worker(num_workers: int) -> None:
+    """Set up the worker's transcriber with its share of the request quota."""
+    global _transcriber
+    Config.REQUESTS_PER_MINUTE = max(1, Config.REQUESTS_PER_MINUTE // num_workers)
+    Config.TOKENS_PER_MINUTE //= num_workers
+    # Rebuild the limiter so it picks up this worker's share rather than the full quota
+    get_rate_limiter.cache_clear()
+    _transcriber = VideoTranscriber()
+
+def _transcribe_one(youtube_id: str) -> Tuple[str, Optional[VideoTranscription]]:
+    """Transcribe a single video in a worker, returning None on failure."""
+    try:
+        return youtube_id, _transcriber.transcribe_youtube_video(youtube_id)
+    except Exception as e:
+        print(f"❌ {youtube_id}: {e}")
+        return youtube_id, None
+
+def _batch_transcribe_mpi(video_ids: List[str]) -> Dict[str, VideoTranscription]:
+    """Shard videos across MPI ranks; only rank 0 gets the merged results."""
+    comm = MPI.COMM_WORLD
+    _init_worker(comm.size)
+    
+    results = [_transcribe_one(youtube_id) for youtube_id in video_ids[comm.rank::comm.size]]
+    gathered = comm.gather(results, root=0)
+    
+    if comm.rank != 0:
+        return {}
+    
+    return {youtube_id: t for rank_results in gathered for youtube_id, t in rank_results if t is not None}
+
+def batch_transcribe(video_ids: List[str], processes: Optional[int] = None) -> Dict[str, VideoTranscription]:
+    """
+    Transcribe YouTube videos in parallel, one video per task.
+    
+    Args:
+        video_ids: YouTube video IDs to transcribe
+        processes: Number of worker processes (default: CPU count, capped at the number of videos)
+    
+    Returns:
+        Transcriptions keyed by video ID (failed videos are omitted)
+    """
+    if not video_ids:
+        return {}
+    
+    if MPI is not None and MPI.COMM_WORLD.size > 1:
+        return _batch_transcribe_mpi(video_ids)
+    
+    processes = min(processes or multiprocessing.cpu_count(), len(video_ids))
+    with multiprocessing.Pool(processes, initializer=_init_worker, initargs=(processes,)) as pool:
+        results = pool.imap_unordered(_transcribe_one, video_ids)
+        return {youtube_id: t for youtube_id, t in results if t is not None}
+
+def main():
+    """Command-line entry point for batch transcription."""
+    parser = argparse.ArgumentParser(
+        description="Transcribe many YouTube videos in parallel",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Transcribe three videos with a local process pool
+  python batch.py 0pJn3g8dfwk gg7WjuFs8F4 nQKmVhLIGcs --output-dir transcripts
+  
+  # Distribute across an MPI cluster
+  mpirun -n 8 python batch.py 0pJn3g8dfwk gg7WjuFs8F4 nQKmVhLIGcs
+        """
+    )
+    
+    parser.add_argument("video_ids", nargs="+", help="YouTube video IDs")
+    parser.add_argument("--processes", type=int, help="Number of worker processes (ignored under MPI)")
+    parser.add_argument("--output-dir", help="Write one JSON file per video to this directory")
+    
+    args = parser.parse_args()
+    
+    transcriptions = batch_transcribe(args.video_ids, processes=args.processes)
+    
+    # Only one process reports under MPI
+    if MPI is not None and MPI.COMM_WORLD.rank != 0:
+        return
+    
+    visualizer = TranscriptionVisualizer()
+    for youtube_id, transcription in transcriptions.items():
+        print(f"\n📺 {youtube_id}")
+        visualizer.display_summary(transcription)
+        
+        if args.output_dir:
+            output_dir = Path(args.output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            visualizer.export_to_json(transcription, str(output_dir / f"{youtube_id}.json"))
+    
+    print(f"\n✅ Transcribed {len(transcriptions)}/{len(args.video_ids)} videos")
+    if len(transcriptions) < len(args.video_ids):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ Configuration module for the multimodal video transcriber.
 Handles environment variables and API setup.
 """
 
+import functools
 import os
 from typing import Optional
 from dotenv import load_dotenv
@@ -13,12 +14,6 @@ load_dotenv()
 class Config:
     """Configuration class for the transcriber."""
     
-    # API Configuration
-    GOOGLE_GENAI_USE_VERTEXAI = os.getenv("GOOGLE_GENAI_USE_VERTEXAI", "False").lower() == "true"
-    GOOGLE_CLOUD_PROJECT = os.getenv("GOOGLE_CLOUD_PROJECT", "")
-    GOOGLE_CLOUD_LOCATION = os.getenv("GOOGLE_CLOUD_LOCATION", "global")
-    GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY", "")
-    
     # Model Configuration
     DEFAULT_MODEL = "gemini-2.0-flash"
     DEFAULT_TEMPERATURE = 0.0
@@ -35,21 +30,67 @@ class Config:
     DEFAULT_TIMECODE_FORMAT = "HH:MM:SS:FF"  # Frame-based format as default
     EXTENDED_TIMECODE_FORMAT = "H:MM:SS"
     SIMPLE_TIMECODE_FORMAT = "MM:SS"
+    TIMECODE_FRAME_RATE = 30  # Frames per second assumed for the FF component
     
     # Output Configuration
     NOT_FOUND_MARKER = "?"
     
+    # Rate Limiting Configuration
+    REQUESTS_PER_MINUTE = int(os.getenv("GEMINI_REQUESTS_PER_MINUTE", "10"))
+    TOKENS_PER_MINUTE = int(os.getenv("GEMINI_TOKENS_PER_MINUTE", "1000000"))  # 0 disables the token limit
+    MAX_CONCURRENCY = 8  # Requests in flight at once for concurrent transcriptions
+    MAX_RETRY_WAIT = 30.0  # Longest wait in seconds between attempts, even if the server hints at more
+    MAX_CIRCUIT_BREAKER_PAUSE = 300.0  # Longest pause in seconds for all requests after a burst of 429s
+    VIDEO_TOKENS_PER_FRAME = 258  # Default media resolution
+    AUDIO_TOKENS_PER_SECOND = 32
+    
+    # Cache Configuration
+    CACHE_DIR = "~/.cache/mmvt"
+    
+    # API Configuration (read lazily so values set after import are picked up)
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def google_genai_use_vertexai(cls) -> bool:
+        """Whether to use Vertex AI instead of Google AI Studio."""
+        return os.getenv("GOOGLE_GENAI_USE_VERTEXAI", "False").lower() == "true"
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def google_cloud_project(cls) -> str:
+        """Google Cloud project ID (Vertex AI)."""
+        return os.getenv("GOOGLE_CLOUD_PROJECT", "")
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def google_cloud_location(cls) -> str:
+        """Google Cloud location (Vertex AI)."""
+        return os.getenv("GOOGLE_CLOUD_LOCATION", "global")
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def google_api_key(cls) -> str:
+        """API key for Google AI Studio."""
+        return os.getenv("GOOGLE_API_KEY", "")
+    
+    @classmethod
+    def invalidate(cls) -> None:
+        """Forget cached environment values so they are re-read on next access."""
+        cls.google_genai_use_vertexai.cache_clear()
+        cls.google_cloud_project.cache_clear()
+        cls.google_cloud_location.cache_clear()
+        cls.google_api_key.cache_clear()
+    
     @classmethod
     def validate_config(cls) -> bool:
         """Validate the configuration."""
-        if cls.GOOGLE_GENAI_USE_VERTEXAI:
+        if cls.google_genai_use_vertexai():
             # Vertex AI configuration
-            if not cls.GOOGLE_CLOUD_PROJECT:
+            if not cls.google_cloud_project():
                 print("❌ GOOGLE_CLOUD_PROJECT is required for Vertex AI")
                 return False
         else:
             # Google AI Studio configuration
-            if not cls.GOOGLE_API_KEY:
+            if not cls.google_api_key():
                 print("❌ GOOGLE_API_KEY is required for Google AI Studio")
                 return False
         
@@ -58,14 +99,12 @@ class Config:
     @classmethod
     def setup_environment(cls) -> None:
         """Setup environment variables for the Google Gen AI SDK."""
-        os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = str(cls.GOOGLE_GENAI_USE_VERTEXAI)
-        os.environ["GOOGLE_CLOUD_PROJECT"] = cls.GOOGLE_CLOUD_PROJECT
-        os.environ["GOOGLE_CLOUD_LOCATION"] = cls.GOOGLE_CLOUD_LOCATION
-        os.environ["GOOGLE_API_KEY"] = cls.GOOGLE_API_KEY
+        os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = str(cls.google_genai_use_vertexai())
+        os.environ["GOOGLE_CLOUD_PROJECT"] = cls.google_cloud_project()
+        os.environ["GOOGLE_CLOUD_LOCATION"] = cls.google_cloud_location()
+        os.environ["GOOGLE_API_KEY"] = cls.google_api_key()
     
     @classmethod
     def get_service_name(cls) -> str:
         """Get the service name being used."""
-        # Check environment variables directly to handle UI configuration
-        use_vertex_ai = os.getenv("GOOGLE_GENAI_USE_VERTEXAI", "False").lower() == "true"
-        return "Vertex AI" if use_vertex_ai else "Google AI Studio"
+        return "Vertex AI" if cls.google_genai_use_vertexai() else "Google AI Studio"
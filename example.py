@@ -2,39 +2,117 @@
 Example script demonstrating how to use the multimodal video transcriber.
 """
 
+import asyncio
+import contextvars
+import functools
+import io
+import sys
+import threading
+from collections import Counter
 from datetime import timedelta
+from typing import Optional, TextIO
 from transcriber import VideoTranscriber
 from visualizer import TranscriptionVisualizer
 from config import Config
 
-def example_basic_transcription():
+# Custom prompt for technical content with enhanced emotion/tonality detection
+_CUSTOM_TECH_PROMPT = """
+**Task 1 - Technical Script Segments**
+
+- Watch the video and listen carefully to the audio.
+- Identify each unique voice using a `voice_id` (1, 2, 3, etc.).
+- Transcribe the video's audio verbatim with voice diarization.
+- Pay special attention to technical terms, proper nouns, and company names.
+- Include the `start_time` and `end_time` timecodes (HH:MM:SS:FF) for each speech segment.
+- Analyze emotion, tone, energy level, and speech rate based on audio and visual cues.
+- For emotion: Detect primary emotion (happy, sad, angry, neutral, excited, worried, etc.)
+- For tone: Identify voice tone (casual, formal, serious, playful, enthusiastic, etc.)
+- For energy_level: Assess energy (low, medium, high)
+- For speech_rate: Determine pace (slow, normal, fast)
+- If information cannot be determined, use `null`
+- Output a JSON array where each object has the following fields:
+  - `start_time`
+  - `end_time`
+  - `text`
+  - `voice_id`
+  - `emotion`
+  - `tone`
+  - `energy_level`
+  - `speech_rate`
+
+**Task 2 - Technical Speakers**
+
+- For each `voice_id` from Task 1, extract information about the corresponding speaker.
+- Use visual and audio cues.
+- Pay special attention to technical titles, company names, and research affiliations.
+- If a piece of information cannot be found, use a question mark (`?`) as the value.
+- Output a JSON array where each object has the following fields:
+  - `voice_id`
+  - `name`
+  - `company`
+  - `position`
+  - `role_in_video`
+"""
+
+# Per-example output buffer; contextvars follow each asyncio task into asyncio.to_thread
+_output_buffer: contextvars.ContextVar[Optional[io.StringIO]] = contextvars.ContextVar("_output_buffer", default=None)
+_print_lock = threading.Lock()
+
+class _BufferedStdout:
+    """Stdout proxy that writes to the current example's buffer, if any."""
+    
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+    
+    def write(self, text: str) -> int:
+        return (_output_buffer.get() or self._stream).write(text)
+    
+    def flush(self) -> None:
+        if _output_buffer.get() is None:
+            self._stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+@functools.lru_cache(maxsize=1)
+def _get_transcriber() -> VideoTranscriber:
+    """Get the transcriber shared by all examples (one client and connection pool)."""
+    return VideoTranscriber()
+
+@functools.lru_cache(maxsize=1)
+def _get_visualizer() -> TranscriptionVisualizer:
+    """Get the visualizer shared by all examples."""
+    return TranscriptionVisualizer()
+
+async def example_basic_transcription():
     """Example 1: Basic transcription of a YouTube video."""
     print("🎬 Example 1: Basic YouTube Transcription")
     print("-" * 50)
     
-    transcriber = VideoTranscriber()
-    visualizer = TranscriptionVisualizer()
+    transcriber = _get_transcriber()
+    visualizer = _get_visualizer()
     
     # Transcribe a short YouTube video
     youtube_id = "0pJn3g8dfwk"  # Google DeepMind Podcast Trailer (59s)
     
-    transcription = transcriber.transcribe_youtube_video(youtube_id)
+    transcription = await asyncio.to_thread(transcriber.transcribe_youtube_video, youtube_id)
     visualizer.display_full_transcription(transcription)
     
     return transcription
 
-def example_video_segment():
+async def example_video_segment():
     """Example 2: Transcribe a specific segment of a video."""
     print("\n🎬 Example 2: Video Segment Transcription")
     print("-" * 50)
     
-    transcriber = VideoTranscriber()
-    visualizer = TranscriptionVisualizer()
+    transcriber = _get_transcriber()
+    visualizer = _get_visualizer()
     
     # Transcribe first 2 minutes of a longer video
     youtube_id = "gg7WjuFs8F4"  # Google DeepMind AlphaFold (7min 54s)
     
-    transcription = transcriber.transcribe_video(
+    transcription = await asyncio.to_thread(
+        transcriber.transcribe_video,
         video_uri=f"https://www.youtube.com/watch?v={youtube_id}",
         start_offset=timedelta(minutes=0),
         end_offset=timedelta(minutes=2),
@@ -43,18 +121,19 @@ def example_video_segment():
     
     return transcription
 
-def example_custom_model():
+async def example_custom_model():
     """Example 3: Using a different Gemini model."""
     print("\n🎬 Example 3: Custom Model (Gemini 2.5 Pro)")
     print("-" * 50)
     
-    transcriber = VideoTranscriber()
-    visualizer = TranscriptionVisualizer()
+    transcriber = _get_transcriber()
+    visualizer = _get_visualizer()
     
     # Use Gemini 2.5 Pro for complex video analysis
     youtube_id = "nQKmVhLIGcs"  # Google DeepMind AI for Science (54min 23s)
     
-    transcription = transcriber.transcribe_youtube_video(
+    transcription = await asyncio.to_thread(
+        transcriber.transcribe_youtube_video,
         youtube_id,
         model="gemini-2.5-pro",
         start_offset=timedelta(minutes=0),
@@ -64,73 +143,35 @@ def example_custom_model():
     
     return transcription
 
-def example_custom_prompt():
+async def example_custom_prompt():
     """Example 4: Using a custom transcription prompt with emotion and tonality."""
     print("\n🎬 Example 4: Custom Prompt with Emotion/Tonality Detection")
     print("-" * 50)
     
-    transcriber = VideoTranscriber()
-    visualizer = TranscriptionVisualizer()
-    
-    # Custom prompt for technical content with enhanced emotion/tonality detection
-    custom_prompt = """
-**Task 1 - Technical Script Segments**
-
-- Watch the video and listen carefully to the audio.
-- Identify each unique voice using a `voice_id` (1, 2, 3, etc.).
-- Transcribe the video's audio verbatim with voice diarization.
-- Pay special attention to technical terms, proper nouns, and company names.
-- Include the `start_time` and `end_time` timecodes (HH:MM:SS:FF) for each speech segment.
-- Analyze emotion, tone, energy level, and speech rate based on audio and visual cues.
-- For emotion: Detect primary emotion (happy, sad, angry, neutral, excited, worried, etc.)
-- For tone: Identify voice tone (casual, formal, serious, playful, enthusiastic, etc.)
-- For energy_level: Assess energy (low, medium, high)
-- For speech_rate: Determine pace (slow, normal, fast)
-- If information cannot be determined, use `null`
-- Output a JSON array where each object has the following fields:
-  - `start_time`
-  - `end_time`
-  - `text`
-  - `voice_id`
-  - `emotion`
-  - `tone`
-  - `energy_level`
-  - `speech_rate`
-
-**Task 2 - Technical Speakers**
-
-- For each `voice_id` from Task 1, extract information about the corresponding speaker.
-- Use visual and audio cues.
-- Pay special attention to technical titles, company names, and research affiliations.
-- If a piece of information cannot be found, use a question mark (`?`) as the value.
-- Output a JSON array where each object has the following fields:
-  - `voice_id`
-  - `name`
-  - `company`
-  - `position`
-  - `role_in_video`
-"""
+    transcriber = _get_transcriber()
+    visualizer = _get_visualizer()
     
     youtube_id = "gg7WjuFs8F4"  # Google DeepMind AlphaFold
     
-    transcription = transcriber.transcribe_video(
+    transcription = await asyncio.to_thread(
+        transcriber.transcribe_video,
         video_uri=f"https://www.youtube.com/watch?v={youtube_id}",
         start_offset=timedelta(minutes=0),
         end_offset=timedelta(minutes=3),
-        custom_prompt=custom_prompt,
+        custom_prompt=_CUSTOM_TECH_PROMPT,
     )
     visualizer.display_full_transcription(transcription)
     
     return transcription
 
-def example_data_analysis():
+async def example_data_analysis():
     """Example 5: Analyzing transcription data."""
     print("\n🎬 Example 5: Data Analysis")
     print("-" * 50)
     
     # Get a transcription first
-    transcriber = VideoTranscriber()
-    transcription = transcriber.transcribe_youtube_video("0pJn3g8dfwk")
+    transcriber = _get_transcriber()
+    transcription = await asyncio.to_thread(transcriber.transcribe_youtube_video, "0pJn3g8dfwk")
     
     # Analyze the data
     print(f"📊 Analysis Results:")
@@ -150,23 +191,24 @@ def example_data_analysis():
                 print(f"     {i+1}. [{segment.start_time}-{segment.end_time}] {segment.text[:50]}...")
     
     # Export to CSV
-    visualizer = TranscriptionVisualizer()
+    visualizer = _get_visualizer()
     visualizer.export_to_csv(transcription, "example_analysis")
     
     return transcription
 
-def example_emotion_tonality_analysis():
+async def example_emotion_tonality_analysis():
     """Example 6: Demonstrating emotion and tonality analysis for AI dubbing."""
     print("\n🎬 Example 6: Emotion and Tonality Analysis for AI Dubbing")
     print("-" * 50)
     
-    transcriber = VideoTranscriber()
-    visualizer = TranscriptionVisualizer()
+    transcriber = _get_transcriber()
+    visualizer = _get_visualizer()
     
     # Transcribe a video segment to analyze emotion and tonality
     youtube_id = "0pJn3g8dfwk"  # Google DeepMind Podcast Trailer
     
-    transcription = transcriber.transcribe_youtube_video(
+    transcription = await asyncio.to_thread(
+        transcriber.transcribe_youtube_video,
         youtube_id,
         start_offset=timedelta(seconds=0),
         end_offset=timedelta(seconds=30),
@@ -180,45 +222,48 @@ def example_emotion_tonality_analysis():
     
     # Analyze emotion distribution
     if transcription.script_segments:
-        emotions = [seg.emotion for seg in transcription.script_segments if seg.emotion]
-        tones = [seg.tone for seg in transcription.script_segments if seg.tone]
-        energies = [seg.energy_level for seg in transcription.script_segments if seg.energy_level]
+        # Count all three attributes in a single pass over the segments
+        emotion_counts, tone_counts, energy_counts = Counter(), Counter(), Counter()
+        for seg in transcription.script_segments:
+            if seg.emotion:
+                emotion_counts[seg.emotion] += 1
+            if seg.tone:
+                tone_counts[seg.tone] += 1
+            if seg.energy_level:
+                energy_counts[seg.energy_level] += 1
         
         print(f"\n📊 Emotion Distribution:")
-        from collections import Counter
-        emotion_counts = Counter(emotions)
         for emotion, count in emotion_counts.items():
             print(f"   {emotion}: {count}")
         
         print(f"\n📊 Tone Distribution:")
-        tone_counts = Counter(tones)
         for tone, count in tone_counts.items():
             print(f"   {tone}: {count}")
         
         print(f"\n📊 Energy Level Distribution:")
-        energy_counts = Counter(energies)
         for energy, count in energy_counts.items():
             print(f"   {energy}: {count}")
     
     return transcription
 
-def example_error_handling():
+async def example_error_handling():
     """Example 7: Error handling and validation."""
     print("\n🎬 Example 7: Error Handling")
     print("-" * 50)
     
-    transcriber = VideoTranscriber()
+    transcriber = _get_transcriber()
     
     # Test invalid YouTube ID
     try:
-        transcription = transcriber.transcribe_youtube_video("invalid_id")
+        transcription = await asyncio.to_thread(transcriber.transcribe_youtube_video, "invalid_id")
         print("✅ Invalid ID handled gracefully")
     except Exception as e:
         print(f"❌ Error with invalid ID: {e}")
     
     # Test invalid FPS
     try:
-        transcription = transcriber.transcribe_video(
+        transcription = await asyncio.to_thread(
+            transcriber.transcribe_video,
             video_uri="https://www.youtube.com/watch?v=0pJn3g8dfwk",
             fps=50.0  # Invalid FPS
         )
@@ -227,22 +272,56 @@ def example_error_handling():
     
     return None
 
+async def run_examples(max_concurrency: int = 3) -> list:
+    """Run all examples concurrently, limiting in-flight Gemini requests."""
+    examples = [
+        example_basic_transcription,
+        example_video_segment,
+        example_custom_model,
+        example_custom_prompt,
+        example_data_analysis,
+        example_emotion_tonality_analysis,
+        example_error_handling,
+    ]
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def run_example(example):
+        async with semaphore:
+            # Each task (and the threads it starts) gets its own context, hence its own buffer
+            buffer = io.StringIO()
+            _output_buffer.set(buffer)
+            try:
+                return await example()
+            finally:
+                with _print_lock:
+                    stdout.write(buffer.getvalue())
+                    stdout.flush()
+    
+    # Buffer each example's output and print it in one piece so concurrent examples don't interleave
+    stdout = sys.stdout
+    sys.stdout = _BufferedStdout(stdout)
+    try:
+        # Collect exceptions so one failing example doesn't cancel the others
+        results = await asyncio.gather(*(run_example(example) for example in examples), return_exceptions=True)
+    finally:
+        sys.stdout = stdout
+    
+    errors = []
+    for example, result in zip(examples, results):
+        if isinstance(result, Exception):
+            errors.append(result)
+            print(f"\n❌ {example.__name__} error: {result}")
+    
+    return errors
+
 def main():
     """Run all examples."""
     print("🎬 Multimodal Video Transcriber Examples")
     print("=" * 60)
     
     try:
-        # Run examples
-        example_basic_transcription()
-        example_video_segment()
-        example_custom_model()
-        example_custom_prompt()
-        example_data_analysis()
-        example_emotion_tonality_analysis()
-        example_error_handling()
-        
-        print("\n✅ All examples completed successfully!")
+        if not asyncio.run(run_examples()):
+            print("\n✅ All examples completed successfully!")
         
     except Exception as e:
         print(f"\n❌ Example error: {e}")
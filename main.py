@@ -5,15 +5,39 @@ Demonstrates usage and provides command-line interface.
 """
 
 import argparse
-import json
+import functools
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from transcriber import VideoTranscriber
-from visualizer import TranscriptionVisualizer
 from config import Config
 
+# The transcriber and visualizer pull in the Gemini SDK and pandas, so they are imported
+# on first use; `--help` and argument errors return without paying for them.
+if TYPE_CHECKING:
+    from transcriber import VideoTranscriber
+    from visualizer import TranscriptionVisualizer
+
+@functools.lru_cache(maxsize=1)
+def _get_transcriber(use_cache: bool = True, refresh_cache: bool = False) -> "VideoTranscriber":
+    """Get a shared transcriber so the client is only set up once per process."""
+    from transcriber import VideoTranscriber
+    
+    return VideoTranscriber(
+        skip_config_validation=False,
+        use_cache=use_cache,
+        refresh_cache=refresh_cache,
+    )
+
+@functools.lru_cache(maxsize=1)
+def _get_visualizer() -> "TranscriptionVisualizer":
+    """Get a shared visualizer."""
+    from visualizer import TranscriptionVisualizer
+    
+    return TranscriptionVisualizer()
+
 def main():
     """Main function for the transcriber."""
     parser = argparse.ArgumentParser(
@@ -35,6 +59,9 @@ Examples:
 
   # Transcribe from Cloud Storage (Vertex AI only)
   python main.py --gs-uri gs://bucket/path/to/video.mp4
+
+  # Re-transcribe, ignoring any cached result
+  python main.py --youtube 0pJn3g8dfwk --refresh-cache
         """
     )
     
@@ -55,12 +82,16 @@ Examples:
     parser.add_argument("--json", help="Export to JSON file")
     parser.add_argument("--quiet", action="store_true", help="Suppress visual output")
     
+    # Cache options
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the transcription cache")
+    parser.add_argument("--refresh-cache", action="store_true", help="Ignore cached results and re-transcribe")
+    
     args = parser.parse_args()
     
     try:
         # Initialize transcriber
-        transcriber = VideoTranscriber(skip_config_validation=False)
-        visualizer = TranscriptionVisualizer()
+        transcriber = _get_transcriber(use_cache=not args.no_cache, refresh_cache=args.refresh_cache)
+        visualizer = _get_visualizer()
         
         # Prepare video URI
         if args.youtube:
@@ -99,9 +130,7 @@ Examples:
             visualizer.export_to_csv(transcription, args.export)
         
         if args.json:
-            with open(args.json, 'w', encoding='utf-8') as f:
-                json.dump(transcription.model_dump(), f, indent=2, ensure_ascii=False)
-            print(f"✅ Exported JSON to: {args.json}")
+            visualizer.export_to_json(transcription, args.json)
         
         # Return success
         if transcription.total_segments > 0:
@@ -119,6 +148,24 @@ Examples:
         print(f"\n❌ Error: {e}")
         sys.exit(1)
 
+# Demo transcriptions: (youtube_id, transcribe kwargs, label)
+DEMO_JOBS = [
+    # Google DeepMind Podcast Trailer (59s)
+    ("0pJn3g8dfwk", {}, "Example 1: Short YouTube video (Google DeepMind Podcast Trailer)"),
+    # Google DeepMind AlphaFold (7min 54s)
+    (
+        "gg7WjuFs8F4",
+        {"start_offset": timedelta(minutes=0), "end_offset": timedelta(minutes=2)},
+        "Example 2: Video segment (first 2 minutes of longer video)",
+    ),
+    # Google DeepMind AI for Science (54min 23s), just the first 5 minutes for the demo
+    (
+        "nQKmVhLIGcs",
+        {"model": "gemini-2.5-pro", "start_offset": timedelta(minutes=0), "end_offset": timedelta(minutes=5)},
+        "Example 3: Using Gemini 2.5 Pro for complex video",
+    ),
+]
+
 def demo():
     """Demo function showing various transcription examples."""
     print("🎬 Multimodal Video Transcriber Demo")
@@ -126,38 +173,19 @@ def demo():
     
     try:
         # Initialize transcriber
-        transcriber = VideoTranscriber(skip_config_validation=False)
-        visualizer = TranscriptionVisualizer()
-        
-        # Example 1: Short YouTube video
-        print("\n📺 Example 1: Short YouTube video (Google DeepMind Podcast Trailer)")
-        youtube_id = "0pJn3g8dfwk"  # Google DeepMind Podcast Trailer (59s)
-        
-        transcription = transcriber.transcribe_youtube_video(youtube_id)
-        visualizer.display_summary(transcription)
-        
-        # Example 2: Video segment
-        print("\n📺 Example 2: Video segment (first 2 minutes of longer video)")
-        youtube_id = "gg7WjuFs8F4"  # Google DeepMind AlphaFold (7min 54s)
-        
-        transcription = transcriber.transcribe_youtube_video(
-            youtube_id,
-            start_offset=timedelta(minutes=0),
-            end_offset=timedelta(minutes=2),
-        )
-        visualizer.display_summary(transcription)
-        
-        # Example 3: Using different model
-        print("\n📺 Example 3: Using Gemini 2.5 Pro for complex video")
-        youtube_id = "nQKmVhLIGcs"  # Google DeepMind AI for Science (54min 23s)
-        
-        transcription = transcriber.transcribe_youtube_video(
-            youtube_id,
-            model="gemini-2.5-pro",
-            start_offset=timedelta(minutes=0),
-            end_offset=timedelta(minutes=5),  # Just first 5 minutes for demo
-        )
-        visualizer.display_summary(transcription)
+        transcriber = _get_transcriber()
+        visualizer = _get_visualizer()
+        
+        # Transcription requests are HTTP-bound, so run them in parallel threads
+        with ThreadPoolExecutor(max_workers=len(DEMO_JOBS)) as executor:
+            futures = {
+                executor.submit(transcriber.transcribe_youtube_video, youtube_id, **kwargs): label
+                for youtube_id, kwargs, label in DEMO_JOBS
+            }
+            
+            for future in as_completed(futures):
+                print(f"\n📺 {futures[future]}")
+                visualizer.display_summary(future.result())
         
         print("\n✅ Demo completed successfully!")
         
@@ -4,10 +4,39 @@ Uses Pydantic for structured output and validation.
 """
 
 from datetime import timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional
 import pydantic
 from config import Config
 
+def timecode_to_frames(timecode: str, frame_rate: int = Config.TIMECODE_FRAME_RATE) -> int:
+    """Convert an HH:MM:SS:FF (or H:MM:SS / MM:SS, with optional fractional seconds) timecode to a frame count."""
+    if "." in timecode:
+        # Fractional seconds (e.g. 00:00:01.500) instead of a frame count
+        *whole, seconds = timecode.strip().split(":")
+        if not 1 <= len(whole) <= 2:
+            raise ValueError(f"Invalid timecode: {timecode!r}")
+        hours, minutes = [0, *(int(part) for part in whole)][-2:]
+        return round(((hours * 60 + minutes) * 60 + float(seconds)) * frame_rate)
+    
+    parts = [int(part) for part in timecode.strip().split(":")]
+    if len(parts) == 4:
+        hours, minutes, seconds, frames = parts
+    elif len(parts) == 3:
+        hours, minutes, seconds, frames = *parts, 0
+    elif len(parts) == 2:
+        hours, minutes, seconds, frames = 0, *parts, 0
+    else:
+        raise ValueError(f"Invalid timecode: {timecode!r}")
+    
+    return ((hours * 60 + minutes) * 60 + seconds) * frame_rate + frames
+
+def frames_to_timecode(frame_count: int, frame_rate: int = Config.TIMECODE_FRAME_RATE) -> str:
+    """Format a frame count as an HH:MM:SS:FF timecode."""
+    seconds, frames = divmod(frame_count, frame_rate)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}:{frames:02d}"
+
 class TranscriptSegment(pydantic.BaseModel):
     """Represents a single transcript segment."""
     start_time: str = pydantic.Field(description="Start time in HH:MM:SS:FF format (hours:minutes:seconds:frames)")
@@ -32,6 +61,22 @@ class TranscriptSegment(pydantic.BaseModel):
                 "speech_rate": "normal"
             }
         }
+    
+    # Integer frame views of the timecodes, for sorting, filtering and durations
+    @property
+    def start_frame(self) -> int:
+        """Get the start time as a frame count."""
+        return timecode_to_frames(self.start_time)
+    
+    @property
+    def end_frame(self) -> int:
+        """Get the end time as a frame count."""
+        return timecode_to_frames(self.end_time)
+    
+    @property
+    def duration(self) -> timedelta:
+        """Get the segment duration."""
+        return timedelta(seconds=(self.end_frame - self.start_frame) / Config.TIMECODE_FRAME_RATE)
 
 class Speaker(pydantic.BaseModel):
     """Represents a speaker identified in the video."""
@@ -138,33 +183,47 @@ class VideoTranscription(pydantic.BaseModel):
             }
         }
     
+    # Lookup indexes derived from the fields above, rebuilt by update_counts()
+    _speaker_by_voice: Dict[int, Speaker] = pydantic.PrivateAttr(default_factory=dict)
+    _speaker_by_name: Dict[str, Speaker] = pydantic.PrivateAttr(default_factory=dict)
+    _segments_by_voice: Dict[int, List[TranscriptSegment]] = pydantic.PrivateAttr(default_factory=dict)
+    
+    def model_post_init(self, __context) -> None:
+        """Build the lookup indexes once the model is validated."""
+        self._build_indexes()
+    
+    def _build_indexes(self) -> None:
+        """Index speakers and segments so lookups don't rescan the lists."""
+        self._speaker_by_voice = {}
+        self._speaker_by_name = {}
+        for speaker in self.speakers:
+            # Keep the first match, as the previous linear scans did
+            self._speaker_by_voice.setdefault(speaker.voice_id, speaker)
+            self._speaker_by_name.setdefault(speaker.name, speaker)
+        
+        self._segments_by_voice = {}
+        for segment in self.script_segments:
+            self._segments_by_voice.setdefault(segment.voice_id, []).append(segment)
+    
     def update_counts(self) -> None:
-        """Update the count fields."""
+        """Update the count fields and lookup indexes (call after mutating the lists)."""
         self.total_segments = len(self.script_segments)
         self.total_speakers = len(self.speakers)
+        self._build_indexes()
+    
+    @property
+    def speaker_by_voice_id(self) -> Dict[int, Speaker]:
+        """Get the speakers keyed by voice ID (read-only; first match wins, refreshed by update_counts)."""
+        return self._speaker_by_voice
     
     def get_speaker_by_voice_id(self, voice_id: int) -> Optional[Speaker]:
         """Get speaker by voice ID."""
-        for speaker in self.speakers:
-            if speaker.voice_id == voice_id:
-                return speaker
-        return None
+        return self._speaker_by_voice.get(voice_id)
     
     def get_segments_by_speaker(self, speaker_name: str) -> List[TranscriptSegment]:
         """Get all segments for a specific speaker."""
-        segments = []
-        speaker = None
-        
-        # Find the speaker
-        for s in self.speakers:
-            if s.name == speaker_name:
-                speaker = s
-                break
-        
-        if speaker:
-            # Get all segments for this speaker's voice_id
-            for segment in self.script_segments:
-                if segment.voice_id == speaker.voice_id:
-                    segments.append(segment)
+        speaker = self._speaker_by_name.get(speaker_name)
+        if not speaker:
+            return []
         
-        return segments
+        return list(self._segments_by_voice.get(speaker.voice_id, []))
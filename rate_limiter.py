@@ -0,0 +1,149 @@
+"""
+Client-side rate limiting for Gemini API calls.
+Keeps concurrent transcriptions under the per-minute request and token quotas instead of tripping 429s,
+and backs off all of them together when 429s keep coming anyway.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, List, Optional
+
+from config import Config
+
+class GeminiRateLimiter:
+    """Thread-safe sliding-window limiter for requests per minute and tokens per minute."""
+    
+    def __init__(self, rpm_limit: int, tpm_limit: Optional[int] = None, window: float = 60.0):
+        """
+        Initialize the limiter.
+        
+        Args:
+            rpm_limit: Maximum requests per window
+            tpm_limit: Maximum tokens per window (None or 0 to only limit requests)
+            window: Window length in seconds
+        """
+        if rpm_limit <= 0 or window <= 0:
+            raise ValueError("rpm_limit and window must be positive")
+        
+        self.rpm_limit = rpm_limit
+        self.tpm_limit = tpm_limit or None
+        self.window = window
+        self._reservations: Deque[List] = deque()  # [timestamp, token cost] per request in the window
+        self._lock = threading.Lock()
+    
+    def _trim(self, now: float) -> None:
+        """Drop entries that have left the window (caller holds the lock)."""
+        while self._reservations and self._reservations[0][0] <= now - self.window:
+            self._reservations.popleft()
+    
+    def _reserve(self, expected_tokens: int) -> tuple:
+        """Reserve a slot if one is free; get (reservation, 0) or (None, seconds to wait)."""
+        with self._lock:
+            now = time.monotonic()
+            self._trim(now)
+            
+            if len(self._reservations) >= self.rpm_limit:
+                return None, self._reservations[0][0] + self.window - now
+            
+            if self.tpm_limit and self._reservations:
+                excess = sum(cost for _, cost in self._reservations) + expected_tokens - self.tpm_limit
+                if excess > 0:
+                    # Wait until enough of the oldest usage leaves the window (an oversized request runs alone)
+                    for timestamp, cost in self._reservations:
+                        excess -= cost
+                        if excess <= 0:
+                            break
+                    return None, timestamp + self.window - now
+            
+            reservation = [now, expected_tokens]
+            self._reservations.append(reservation)
+            return reservation, 0.0
+    
+    def acquire(self, expected_tokens: int = 0) -> List:
+        """Block until a request (and its expected tokens) fits the quota; get the reservation."""
+        while True:
+            reservation, delay = self._reserve(expected_tokens)
+            if reservation is not None:
+                return reservation
+            time.sleep(delay)
+    
+    async def acquire_async(self, expected_tokens: int = 0) -> List:
+        """Async counterpart of `acquire` that doesn't block the event loop."""
+        while True:
+            reservation, delay = self._reserve(expected_tokens)
+            if reservation is not None:
+                return reservation
+            await asyncio.sleep(delay)
+    
+    def record_usage(self, reservation: List, tokens: int) -> None:
+        """Replace a reservation's expected tokens with the tokens the request actually used."""
+        with self._lock:
+            reservation[1] = tokens
+
+class GeminiCircuitBreaker:
+    """Thread-safe breaker that pauses all requests after a burst of 429 responses."""
+    
+    def __init__(self, threshold: int = 5, window: float = 30.0, cooldown: float = 60.0, max_pause: float = 300.0):
+        """
+        Initialize the breaker.
+        
+        Args:
+            threshold: Number of 429s within the window that opens the breaker
+            window: Window length in seconds
+            cooldown: Pause in seconds once open, when the server gives no reset hint
+            max_pause: Longest pause in seconds, however far off the server's reset hint is
+        """
+        self.threshold = threshold
+        self.window = window
+        self.cooldown = cooldown
+        self.max_pause = max_pause
+        self.open_until = 0.0
+        self._rate_limited_at: Deque[float] = deque()
+        self._lock = threading.Lock()
+    
+    def record_rate_limit(self, retry_after: Optional[float] = None) -> None:
+        """Count a 429 response, opening the breaker once the threshold is reached."""
+        with self._lock:
+            now = time.monotonic()
+            self._rate_limited_at.append(now)
+            while self._rate_limited_at[0] <= now - self.window:
+                self._rate_limited_at.popleft()
+            
+            if len(self._rate_limited_at) >= self.threshold:
+                pause = max(self.cooldown, min(retry_after or 0.0, self.max_pause))
+                self.open_until = max(self.open_until, now + pause)
+                self._rate_limited_at.clear()
+                print(f"⛔ Rate limited repeatedly, pausing requests for {pause:.0f}s")
+    
+    def _remaining(self) -> float:
+        """Get the seconds left before the breaker closes."""
+        return self.open_until - time.monotonic()
+    
+    def guard(self) -> None:
+        """Block while the breaker is open."""
+        while (remaining := self._remaining()) > 0:
+            time.sleep(remaining)
+    
+    async def guard_async(self) -> None:
+        """Async counterpart of `guard` that doesn't block the event loop."""
+        while (remaining := self._remaining()) > 0:
+            await asyncio.sleep(remaining)
+
+@functools.lru_cache(maxsize=1)
+def get_rate_limiter() -> GeminiRateLimiter:
+    """Get the limiter shared by every transcriber in this process."""
+    return GeminiRateLimiter(Config.REQUESTS_PER_MINUTE, Config.TOKENS_PER_MINUTE)
+
+@functools.lru_cache(maxsize=1)
+def get_circuit_breaker() -> GeminiCircuitBreaker:
+    """Get the circuit breaker shared by every transcriber in this process."""
+    return GeminiCircuitBreaker(max_pause=Config.MAX_CIRCUIT_BREAKER_PAUSE)
+
+# A forked child gets its own quota and breaker state instead of a copy of the parent's (fork is Unix-only)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=get_rate_limiter.cache_clear)
+    os.register_at_fork(after_in_child=get_circuit_breaker.cache_clear)
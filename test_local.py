@@ -4,7 +4,14 @@ Simple test script to verify the transcriber works locally.
 Run this before testing the web interface.
 """
 
+import asyncio
+import json
 import os
+import threading
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from google import genai
+from google.genai.types import HttpOptions
 from transcriber import VideoTranscriber
 from visualizer import TranscriptionVisualizer
 
@@ -67,6 +74,76 @@ def test_transcriber():
         print("   3. Verify the YouTube video is accessible")
         return False
 
+class _FakeGeminiHandler(BaseHTTPRequestHandler):
+    """Local stand-in for the Gemini API that answers every request with one segment."""
+    
+    protocol_version = "HTTP/1.1"  # Keep-alive, so the client reuses pooled connections like it does in production
+    body = json.dumps({
+        "candidates": [{
+            "content": {"role": "model", "parts": [{"text": json.dumps({
+                "script_segments": [{"start_time": "00:00:01:00", "end_time": "00:00:02:00", "text": "Hi", "voice_id": 1}],
+                "speakers": [{"voice_id": 1, "name": "Ann", "company": "?", "position": "?", "role_in_video": "?"}],
+            })}]},
+            "finishReason": "STOP",
+        }],
+    }).encode()
+    
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+    
+    def log_message(self, *args):
+        pass
+
+def test_async_wrappers():
+    """Test that the blocking async wrappers can be called repeatedly (no API key needed)."""
+    print("\n🔁 Testing repeated concurrent transcriptions")
+    print("=" * 50)
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeGeminiHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    try:
+        transcriber = VideoTranscriber(skip_config_validation=True, use_cache=False)
+        transcriber.client = genai.Client(
+            api_key="test",
+            http_options=HttpOptions(base_url=f"http://127.0.0.1:{server.server_port}"),
+        )
+        
+        # Each call used to get a new event loop, breaking the client's pooled async connections
+        for youtube_id in ("first", "second"):
+            results = transcriber.transcribe_videos([f"https://www.youtube.com/watch?v={youtube_id}"])
+            if isinstance(results[0], BaseException) or results[0].total_segments != 1:
+                print(f"❌ transcribe_videos failed: {results[0]!r}")
+                return False
+        
+        # Callers driving their own event loops share the same client
+        for youtube_id in ("third", "fourth"):
+            results = asyncio.run(transcriber.transcribe_videos_async([f"https://www.youtube.com/watch?v={youtube_id}"]))
+            if isinstance(results[0], BaseException) or results[0].total_segments != 1:
+                print(f"❌ transcribe_videos_async failed: {results[0]!r}")
+                return False
+        
+        transcription = transcriber.transcribe_video_chunked(
+            "https://www.youtube.com/watch?v=chunked", video_duration=timedelta(seconds=30)
+        )
+        if transcription.total_segments != 1:
+            print("❌ transcribe_video_chunked returned no segments")
+            return False
+        
+        print("✅ Repeated transcribe_videos and transcribe_video_chunked calls work")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error testing async wrappers: {e!r}")
+        return False
+    finally:
+        server.shutdown()
+
 def test_web_interface():
     """Test if Streamlit can be imported."""
     print("\n🌐 Testing Web Interface Setup")
@@ -101,11 +178,14 @@ if __name__ == "__main__":
     # Test transcriber
     transcriber_ok = test_transcriber()
     
+    # Test the async wrappers against a local fake API
+    async_ok = test_async_wrappers()
+    
     # Test web interface
     web_ok = test_web_interface()
     
     print("\n" + "=" * 60)
-    if transcriber_ok and web_ok:
+    if transcriber_ok and async_ok and web_ok:
         print("🎉 All tests passed! Your transcriber is ready to use.")
         print("\n📋 Next steps:")
         print("   1. Get API key from: https://aistudio.google.com/app/apikey")
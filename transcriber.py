@@ -2,18 +2,28 @@
 Main transcriber module for multimodal video transcription using Google Gemini.
 """
 
+import asyncio
+import functools
+import itertools
 import os
 import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import timedelta
-from typing import Optional, List
+from typing import Any, Coroutine, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
+import pydantic
 import tenacity
 from google import genai
-from google.genai.errors import ClientError
+from google.genai.errors import APIError
 from google.genai.types import (
+    CreateBatchJobConfig,
     FileData,
     FinishReason,
     GenerateContentConfig,
     GenerateContentResponse,
+    InlinedRequest,
+    JobState,
     Part,
     VideoMetadata,
     MediaResolution,
@@ -21,49 +31,41 @@ from google.genai.types import (
 )
 
 from config import Config
-from models import VideoTranscription, TranscriptSegment, Speaker
+from models import VideoTranscription, TranscriptSegment, Speaker, frames_to_timecode, timecode_to_frames
+from rate_limiter import get_circuit_breaker, get_rate_limiter
+from transcription_cache import TranscriptionCache
 
-class VideoTranscriber:
-    """Main class for video transcription using Google Gemini."""
-    
-    def __init__(self, skip_config_validation: bool = False):
-        """Initialize the transcriber."""
-        # Setup configuration only if not skipping validation
-        if not skip_config_validation:
-            Config.setup_environment()
-            
-            if not Config.validate_config():
-                raise ValueError("Invalid configuration. Please check your environment variables.")
-        
-        # Initialize Gemini client
-        # Always check for API key in environment first, regardless of skip_config_validation
-        api_key = os.getenv("GOOGLE_API_KEY")
-        if api_key:
-            # Ensure the API key is set in environment for the client
-            os.environ["GOOGLE_API_KEY"] = api_key
-            self.client = genai.Client(api_key=api_key)
-        elif skip_config_validation:
-            # For testing without API key, set client to None
-            self.client = None
-        else:
-            self.client = genai.Client()
-        
-        self.service_name = Config.get_service_name()
-        
-        if self.client:
-            print(f"✅ Using {self.service_name} API")
-    
-    def get_transcription_prompt(self, timecode_format: str = None) -> str:
-        """Get the transcription prompt with proper formatting."""
-        if timecode_format is None:
-            timecode_format = Config.DEFAULT_TIMECODE_FORMAT
-        return f"""
+T = TypeVar("T")
+
+# Requests currently being sent to Gemini, keyed by cache key (shared by all transcribers)
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+# Transient HTTP errors worth retrying, and the 400 messages that are transient too
+_RETRYABLE_CODES = frozenset({429, 500, 502, 503, 504})
+_RETRY_400_RE = re.compile(r"(try again|please retry|internal error)", re.IGNORECASE)
+
+# Retry schedule when the server gives no retry hint
+_RETRY_BACKOFF = tenacity.wait_exponential_jitter(initial=2, max=Config.MAX_RETRY_WAIT, jitter=2)
+
+# Batch job states after which polling stops
+_BATCH_DONE_STATES = frozenset({
+    JobState.JOB_STATE_SUCCEEDED,
+    JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+    JobState.JOB_STATE_FAILED,
+    JobState.JOB_STATE_CANCELLED,
+    JobState.JOB_STATE_EXPIRED,
+})
+
+# Static halves of the transcription prompt around the timecode format
+_PROMPT_PREFIX = """
 **Task 1 - Script Segments**
 
 - Watch the video and listen carefully to the audio.
 - Identify each unique voice using a `voice_id` (1, 2, 3, etc.).
 - Transcribe the video's audio verbatim with voice diarization.
-- Include the `start_time` and `end_time` timecodes ({timecode_format}) for each speech segment.
+- Include the `start_time` and `end_time` timecodes ("""
+_PROMPT_SUFFIX = """) for each speech segment.
 - Analyze the emotion, tone, energy, and speech rate for each segment based on audio and visual cues.
 - For emotion: Detect the primary emotion (happy, sad, angry, neutral, excited, worried, frustrated, calm, etc.)
 - For tone: Identify the tone of voice (casual, formal, serious, playful, enthusiastic, sarcastic, empathetic, etc.)
@@ -92,6 +94,144 @@ class VideoTranscriber:
   - `position`
   - `role_in_video`
 """
+
+@functools.lru_cache(maxsize=8)
+def _build_transcription_prompt(timecode_format: str) -> str:
+    """Build the default transcription prompt (it only depends on the timecode format)."""
+    return _PROMPT_PREFIX + timecode_format + _PROMPT_SUFFIX
+
+@functools.lru_cache(maxsize=16)
+def _build_generate_content_config(model: str, media_resolution: Optional[MediaResolution]) -> GenerateContentConfig:
+    """Build the content generation config template for a model."""
+    config = GenerateContentConfig(
+        temperature=Config.DEFAULT_TEMPERATURE,
+        top_p=Config.DEFAULT_TOP_P,
+        seed=Config.DEFAULT_SEED,
+        response_mime_type="application/json",
+        response_schema=VideoTranscription,
+    )
+    
+    # Set media resolution if provided
+    if media_resolution:
+        config.media_resolution = media_resolution
+    
+    # Set thinking config for Gemini 2.5 models
+    if "2.5" in model:
+        if "flash" in model:
+            config.thinking_config = ThinkingConfig(thinking_budget=0, include_thoughts=False)
+        elif "pro" in model:
+            config.thinking_config = ThinkingConfig(thinking_budget=128, include_thoughts=False)
+    
+    return config
+
+@functools.lru_cache(maxsize=4)
+def _get_genai_client(api_key: str, use_vertexai: bool, project: str, location: str) -> genai.Client:
+    """Get a Gemini client shared by every transcriber with the same settings (its connection pool is reused)."""
+    # Its async calls only ever run on the loop from _get_event_loop, so sharing the aio transport is safe
+    # Settings are passed explicitly so the SDK never falls back to (possibly changed) environment variables
+    if use_vertexai:
+        return genai.Client(vertexai=True, project=project, location=location)
+    
+    return genai.Client(vertexai=False, api_key=api_key)
+
+@functools.lru_cache(maxsize=1)
+def _get_blocking_executor() -> ThreadPoolExecutor:
+    """Get the bounded thread pool that runs blocking SDK calls for async callers."""
+    return ThreadPoolExecutor(max_workers=Config.MAX_CONCURRENCY, thread_name_prefix="gemini")
+
+@functools.lru_cache(maxsize=1)
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the long-lived event loop that runs every async Gemini call in this process."""
+    # The client's async transport is bound to the loop it first ran on, so it must never change loops
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="gemini-event-loop", daemon=True).start()
+    return loop
+
+def _run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the shared event loop and block until it's done."""
+    return asyncio.run_coroutine_threadsafe(coroutine, _get_event_loop()).result()
+
+# A forked child must not reuse the parent's connections, threads or event loop (fork is Unix-only)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_get_genai_client.cache_clear)
+    os.register_at_fork(after_in_child=_get_blocking_executor.cache_clear)
+    os.register_at_fork(after_in_child=_get_event_loop.cache_clear)
+
+class VideoTranscriber:
+    """Main class for video transcription using Google Gemini."""
+    
+    def __init__(
+        self,
+        skip_config_validation: bool = False,
+        use_cache: bool = True,
+        refresh_cache: bool = False,
+        use_vertex_ai: Optional[bool] = None,
+        project_id: Optional[str] = None,
+        location: Optional[str] = None,
+        api_key: Optional[str] = None,
+    ):
+        """
+        Initialize the transcriber.
+        
+        Args:
+            skip_config_validation: Skip environment validation (e.g. when configured from the UI)
+            use_cache: Reuse transcriptions stored in the persistent cache
+            refresh_cache: Ignore cached results but still store new ones
+            use_vertex_ai: Use Vertex AI instead of Google AI Studio (default: from the environment)
+            project_id: Google Cloud project ID for Vertex AI (default: from the environment)
+            location: Google Cloud location for Vertex AI (default: from the environment)
+            api_key: Google AI Studio API key (default: from the environment)
+        """
+        # Credentials are fixed now, so later environment changes (e.g. by another app session) can't rebind the client
+        self.use_vertex_ai = Config.google_genai_use_vertexai() if use_vertex_ai is None else use_vertex_ai
+        self.project_id = Config.google_cloud_project() if project_id is None else project_id
+        self.location = Config.google_cloud_location() if location is None else location
+        self.api_key = Config.google_api_key() if api_key is None else api_key
+        
+        # Validation and client construction are deferred until the API is actually needed
+        self.skip_config_validation = skip_config_validation
+        self._validated = False
+        
+        self.service_name = "Vertex AI" if self.use_vertex_ai else "Google AI Studio"
+        self.cache = TranscriptionCache() if use_cache else None
+        self.refresh_cache = refresh_cache
+        self.rate_limiter = get_rate_limiter()
+        self.circuit_breaker = get_circuit_breaker()
+    
+    def _ensure_validated(self) -> None:
+        """Set up and validate the environment once, unless validation is skipped."""
+        if self.skip_config_validation or self._validated:
+            return
+        
+        if self.use_vertex_ai and not self.project_id:
+            print("❌ GOOGLE_CLOUD_PROJECT is required for Vertex AI")
+        elif not self.use_vertex_ai and not self.api_key:
+            print("❌ GOOGLE_API_KEY is required for Google AI Studio")
+        else:
+            self._validated = True
+            return
+        
+        raise ValueError("Invalid configuration. Please check your environment variables.")
+        
+        self._validated = True
+    
+    @functools.cached_property
+    def client(self) -> Optional[genai.Client]:
+        """Get the shared Gemini client on first use."""
+        self._ensure_validated()
+        
+        if not (self.project_id if self.use_vertex_ai else self.api_key) and self.skip_config_validation:
+            # For testing without credentials, there is no client
+            return None
+        
+        client = _get_genai_client(self.api_key, self.use_vertex_ai, self.project_id, self.location)
+        
+        print(f"✅ Using {self.service_name} API")
+        return client
+    
+    def get_transcription_prompt(self, timecode_format: str = None) -> str:
+        """Get the transcription prompt with proper formatting."""
+        return _build_transcription_prompt(timecode_format or Config.DEFAULT_TIMECODE_FORMAT)
     
     def get_video_part(
         self,
@@ -129,57 +269,77 @@ class VideoTranscriber:
         media_resolution: MediaResolution = None,
     ) -> GenerateContentConfig:
         """Get the configuration for content generation."""
-        model = model or Config.DEFAULT_MODEL
-        
-        config = GenerateContentConfig(
-            temperature=Config.DEFAULT_TEMPERATURE,
-            top_p=Config.DEFAULT_TOP_P,
-            seed=Config.DEFAULT_SEED,
-            response_mime_type="application/json",
-            response_schema=VideoTranscription,
-        )
-        
-        # Set media resolution if provided
-        if media_resolution:
-            config.media_resolution = media_resolution
-        
-        # Set thinking config for Gemini 2.5 models
-        if "2.5" in model:
-            if "flash" in model:
-                config.thinking_config = ThinkingConfig(thinking_budget=0, include_thoughts=False)
-            elif "pro" in model:
-                config.thinking_config = ThinkingConfig(thinking_budget=128, include_thoughts=False)
-        
-        return config
+        # Shallow copy so callers can't mutate the shared template
+        return _build_generate_content_config(model or Config.DEFAULT_MODEL, media_resolution).model_copy()
     
     def get_retrier(self) -> tenacity.Retrying:
         """Get retry configuration for API calls."""
-        return tenacity.Retrying(
+        return tenacity.Retrying(**self._get_retry_options())
+    
+    def get_async_retrier(self) -> tenacity.AsyncRetrying:
+        """Get retry configuration for async API calls."""
+        return tenacity.AsyncRetrying(**self._get_retry_options())
+    
+    def _get_retry_options(self) -> dict:
+        """Get the retry options shared by the sync and async retriers."""
+        return dict(
             stop=tenacity.stop_after_attempt(7),
-            wait=tenacity.wait_incrementing(start=10, increment=1),
+            wait=self._get_retry_wait,
             retry=self._should_retry_request,
             reraise=True,
         )
     
+    def _get_retry_wait(self, retry_state: tenacity.RetryCallState) -> float:
+        """Get the delay before the next attempt, preferring the server's retry hint."""
+        err = retry_state.outcome.exception() if retry_state.outcome else None
+        if isinstance(err, APIError) and (retry_after := self._get_retry_after(err)) is not None:
+            print(f"⏱️  Server asked to retry after {retry_after:.0f}s")
+            # A daily quota hint can be hours long, which would stall every attempt
+            return min(retry_after, Config.MAX_RETRY_WAIT)
+        
+        return _RETRY_BACKOFF(retry_state)
+    
+    def _get_retry_after(self, err: APIError) -> Optional[float]:
+        """Get the retry delay from the `Retry-After` header or the error's RetryInfo detail, if any."""
+        headers = getattr(err.response, "headers", None) or {}
+        try:
+            if (value := headers.get("Retry-After")) is not None:
+                return float(value)
+        except ValueError:
+            pass  # HTTP-date form; fall back to the error details
+        
+        error = err.details.get("error", {}) if isinstance(err.details, dict) else {}
+        for detail in error.get("details") or []:
+            if isinstance(detail, dict) and (delay := detail.get("retryDelay")):
+                try:
+                    return float(str(delay).rstrip("s"))
+                except ValueError:
+                    return None
+        
+        return None
+    
     def _should_retry_request(self, retry_state: tenacity.RetryCallState) -> bool:
         """Determine if a request should be retried."""
         if not retry_state.outcome:
             return False
         
         err = retry_state.outcome.exception()
-        if not isinstance(err, ClientError):
+        if not isinstance(err, APIError):
             return False
         
+        error_type = type(err).__name__
         try:
-            print(f"❌ ClientError {err.code}: {err.message}")
+            print(f"❌ {error_type} {err.code}: {err.message}")
         except UnicodeEncodeError:
-            print(f"ClientError {err.code}: {err.message.encode('ascii', 'replace').decode()}")
+            print(f"{error_type} {err.code}: {err.message.encode('ascii', 'replace').decode()}")
+        
+        # Repeated 429s pause every request in the process, not just this one
+        if err.code == 429:
+            self.circuit_breaker.record_rate_limit(self._get_retry_after(err))
         
-        retry = False
-        if err.code == 400 and err.message and " try again " in err.message:
-            retry = True
-        elif err.code == 429:
-            retry = True
+        retry = err.code in _RETRYABLE_CODES or (
+            err.code == 400 and bool(err.message) and bool(_RETRY_400_RE.search(err.message))
+        )
         
         print(f"🔄 Retry: {retry}")
         return retry
@@ -212,17 +372,356 @@ class VideoTranscriber:
         Returns:
             VideoTranscription object with results
         """
+        model, prompt, cache_key = self._prepare_request(video_uri, start_offset, end_offset, fps, model, custom_prompt)
+        if (cached := self._get_cached(cache_key)) is not None:
+            return cached
+        
+        pending, is_owner = self._claim_request(cache_key)
+        if not is_owner:
+            return pending.result().model_copy(deep=True)
+        
+        try:
+            transcription = self._request_transcription(video_uri, start_offset, end_offset, fps, model, prompt)
+            self._store_cached(cache_key, transcription)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set_result(transcription)
+        finally:
+            self._release_request(cache_key)
+        
+        return transcription
+    
+    async def _transcribe_video_async(
+        self,
+        video_uri: str,
+        start_offset: Optional[timedelta] = None,
+        end_offset: Optional[timedelta] = None,
+        fps: Optional[float] = None,
+        model: str = None,
+        custom_prompt: str = None,
+    ) -> VideoTranscription:
+        """Async counterpart of `transcribe_video` using the client's aio API."""
+        model, prompt, cache_key = self._prepare_request(video_uri, start_offset, end_offset, fps, model, custom_prompt)
+        if (cached := self._get_cached(cache_key)) is not None:
+            return cached
+        
+        pending, is_owner = self._claim_request(cache_key)
+        if not is_owner:
+            return (await asyncio.wrap_future(pending)).model_copy(deep=True)
+        
+        try:
+            transcription = await self._request_transcription_async(video_uri, start_offset, end_offset, fps, model, prompt)
+            self._store_cached(cache_key, transcription)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set_result(transcription)
+        finally:
+            self._release_request(cache_key)
+        
+        return transcription
+    
+    async def transcribe_videos_async(
+        self,
+        video_uris: List[str],
+        max_concurrency: int = Config.MAX_CONCURRENCY,
+        **kwargs
+    ) -> List[Union[VideoTranscription, BaseException]]:
+        """
+        Transcribe several videos concurrently.
+        
+        Args:
+            video_uris: URIs of the videos
+            max_concurrency: Maximum number of requests in flight at once
+            **kwargs: Options passed to `transcribe_video` for every video
+            
+        Returns:
+            One result per URI, in order; failed videos hold the raised exception
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def worker(video_uri: str) -> VideoTranscription:
+            async with semaphore:
+                return await self._transcribe_video_async(video_uri, **kwargs)
+        
+        return await asyncio.gather(*(worker(uri) for uri in video_uris), return_exceptions=True)
+    
+    def transcribe_videos(
+        self,
+        video_uris: List[str],
+        max_concurrency: int = Config.MAX_CONCURRENCY,
+        **kwargs
+    ) -> List[Union[VideoTranscription, BaseException]]:
+        """Transcribe several videos concurrently (blocking wrapper around `transcribe_videos_async`)."""
+        return _run_sync(self.transcribe_videos_async(video_uris, max_concurrency, **kwargs))
+    
+    async def transcribe_video_chunked_async(
+        self,
+        video_uri: str,
+        video_duration: timedelta,
+        chunk_seconds: int = 900,
+        overlap_seconds: int = 5,
+        max_concurrency: int = Config.MAX_CONCURRENCY,
+        **kwargs
+    ) -> VideoTranscription:
+        """
+        Transcribe a long video as overlapping chunks sent concurrently, then merge them.
+        
+        Args:
+            video_uri: URI of the video
+            video_duration: Total length of the video
+            chunk_seconds: Length of each chunk
+            overlap_seconds: Overlap between consecutive chunks, so no speech is cut at a boundary
+            max_concurrency: Maximum number of chunk requests in flight at once
+            **kwargs: Options passed to `transcribe_video` for every chunk (except the offsets)
+            
+        Returns:
+            VideoTranscription covering the whole video
+        """
+        total_seconds = int(video_duration.total_seconds())
+        if total_seconds <= 0:
+            raise ValueError("video_duration must be at least one second")
+        if not 0 <= overlap_seconds < chunk_seconds:
+            raise ValueError("overlap_seconds must be non-negative and shorter than chunk_seconds")
+        
+        chunk_bounds = []
+        start = 0
+        while True:
+            end = min(start + chunk_seconds, total_seconds)
+            chunk_bounds.append((start, end))
+            if end >= total_seconds:
+                break
+            start = end - overlap_seconds
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def worker(start: int, end: int) -> VideoTranscription:
+            async with semaphore:
+                return await self._transcribe_video_async(
+                    video_uri,
+                    start_offset=timedelta(seconds=start),
+                    end_offset=timedelta(seconds=end),
+                    **kwargs,
+                )
+        
+        chunks = await asyncio.gather(*(worker(start, end) for start, end in chunk_bounds))
+        
+        merged = self._merge_chunks([start for start, _ in chunk_bounds], chunks, overlap_seconds)
+        merged.video_duration = frames_to_timecode(total_seconds * Config.TIMECODE_FRAME_RATE)
+        return merged
+    
+    def transcribe_video_chunked(
+        self,
+        video_uri: str,
+        video_duration: timedelta,
+        **kwargs
+    ) -> VideoTranscription:
+        """Transcribe a long video in concurrent chunks (blocking wrapper around `transcribe_video_chunked_async`)."""
+        return _run_sync(self.transcribe_video_chunked_async(video_uri, video_duration, **kwargs))
+    
+    def submit_batch(
+        self,
+        jobs: List[dict],
+        model: str = None,
+        display_name: Optional[str] = None,
+    ) -> str:
+        """
+        Submit videos to the Gemini Batch API for offline transcription (cheaper, no per-request throttling).
+        
+        Args:
+            jobs: One dict per video with `video_uri` and optionally `start_offset`, `end_offset`, `fps`, `custom_prompt`
+            model: Gemini model to use for the whole batch
+            display_name: Optional name shown in the batch listing
+            
+        Returns:
+            Name of the batch job, to pass to `poll_batch`
+        """
+        if self.client and self.client.vertexai:
+            raise ValueError("Batch transcription requires Google AI Studio (Vertex AI batches need a Cloud Storage source)")
+        
+        model = model or Config.DEFAULT_MODEL
+        requests = []
+        for job in jobs:
+            video_uri = job["video_uri"]
+            start_offset, end_offset, fps = job.get("start_offset"), job.get("end_offset"), job.get("fps")
+            
+            _, prompt, cache_key = self._prepare_request(
+                video_uri, start_offset, end_offset, fps, model, job.get("custom_prompt")
+            )
+            if not (request := self._build_request(video_uri, start_offset, end_offset, fps, model, prompt)):
+                raise ValueError(f"Unsupported video for batch transcription: {video_uri}")
+            
+            contents, config = request
+            # The cache key comes back with the response so results can be cached
+            requests.append(InlinedRequest(contents=contents, config=config, metadata={"cache_key": cache_key}))
+        
+        batch_job = self.client.batches.create(
+            model=model,
+            src=requests,
+            config=CreateBatchJobConfig(display_name=display_name) if display_name else None,
+        )
+        print(f"📦 Submitted batch {batch_job.name} ({len(requests)} videos)")
+        
+        return batch_job.name
+    
+    def poll_batch(self, batch_name: str, poll_interval: float = 60) -> Iterator[VideoTranscription]:
+        """
+        Wait for a batch submitted with `submit_batch` to finish and yield its transcriptions.
+        
+        Args:
+            batch_name: Name returned by `submit_batch`
+            poll_interval: Seconds between status checks
+            
+        Returns:
+            Transcriptions in job order (empty for requests that failed)
+        """
+        while True:
+            batch_job = self.client.batches.get(name=batch_name)
+            if batch_job.state in _BATCH_DONE_STATES:
+                break
+            
+            print(f"⏳ Batch {batch_name}: {batch_job.state.name if batch_job.state else 'unknown'}")
+            time.sleep(poll_interval)
+        
+        if batch_job.state not in (JobState.JOB_STATE_SUCCEEDED, JobState.JOB_STATE_PARTIALLY_SUCCEEDED):
+            raise RuntimeError(f"Batch {batch_name} ended in state {batch_job.state.name}: {batch_job.error}")
+        
+        for inlined in batch_job.dest.inlined_responses or []:
+            if inlined.error or not inlined.response:
+                print(f"❌ Batch request failed: {inlined.error}")
+                yield VideoTranscription()
+                continue
+            
+            transcription = self._parse_text_response(inlined.response)
+            if cache_key := (inlined.metadata or {}).get("cache_key"):
+                self._store_cached(cache_key, transcription)
+            
+            yield transcription
+    
+    def _merge_chunks(
+        self,
+        chunk_starts: List[int],
+        chunks: List[VideoTranscription],
+        overlap_seconds: int,
+    ) -> VideoTranscription:
+        """Merge chunk transcriptions into one, on the full video's timeline and with consistent voice IDs."""
+        frame_rate = Config.TIMECODE_FRAME_RATE
+        merged = VideoTranscription()
+        speaker_for_voice: Dict[int, Speaker] = {}
+        voice_for_name: Dict[str, int] = {}
+        voice_ids = itertools.count(1)
+        
+        for chunk_start, chunk in zip(chunk_starts, chunks):
+            start_frame = chunk_start * frame_rate
+            overlap_end_frame = start_frame + overlap_seconds * frame_rate
+            shift = self._get_chunk_shift(chunk, start_frame, start_frame - overlap_seconds * frame_rate)
+            voice_map = self._map_chunk_voices(chunk, speaker_for_voice, voice_for_name, voice_ids)
+            
+            # Lines in the overlap were already transcribed at the end of the previous chunk
+            overlap_texts = {
+                segment.text.strip()
+                for segment in merged.script_segments
+                if (self._parse_timecode(segment.end_time) or 0) > start_frame
+            }
+            for segment in chunk.script_segments:
+                segment = self._shift_segment(segment, shift)
+                segment_start = self._parse_timecode(segment.start_time)
+                if segment_start is not None and segment_start < overlap_end_frame and segment.text.strip() in overlap_texts:
+                    continue
+                
+                # Only a voice without a speaker entry takes a new ID
+                if segment.voice_id not in voice_map:
+                    voice_map[segment.voice_id] = next(voice_ids)
+                merged.script_segments.append(segment.model_copy(update={"voice_id": voice_map[segment.voice_id]}))
+            
+            line_offset = len(merged.translation_table)
+            merged.translation_table.extend(
+                line.model_copy(update={"line_number": line.line_number + line_offset})
+                for line in chunk.translation_table
+            )
+            merged.language_detected = merged.language_detected or chunk.language_detected
+        
+        # Leave out speakers with no lines left (e.g. all of them were overlap duplicates)
+        speaking = {segment.voice_id for segment in merged.script_segments}
+        merged.speakers = [speaker for voice_id, speaker in speaker_for_voice.items() if voice_id in speaking]
+        
+        merged.update_counts()
+        return merged
+    
+    def _get_chunk_shift(self, chunk: VideoTranscription, start_frame: int, earliest_frame: int) -> int:
+        """Get the frames to add to a chunk's timecodes (0 if they're already on the video's timeline)."""
+        frames = [
+            frame for segment in chunk.script_segments
+            if (frame := self._parse_timecode(segment.start_time)) is not None
+        ]
+        
+        # Timecodes before the chunk (and its overlap) can only be relative to the chunk
+        return start_frame if frames and min(frames) < earliest_frame else 0
+    
+    def _map_chunk_voices(
+        self,
+        chunk: VideoTranscription,
+        speaker_for_voice: Dict[int, Speaker],
+        voice_for_name: Dict[str, int],
+        voice_ids: Iterator[int],
+    ) -> Dict[int, int]:
+        """Map a chunk's voice IDs to merged ones, adding its new speakers to `speaker_for_voice`."""
+        # Named speakers keep one voice ID across chunks; anyone else gets a fresh ID
+        voice_map: Dict[int, int] = {}
+        for speaker in chunk.speakers:
+            if speaker.voice_id in voice_map:
+                continue
+            named = speaker.name != Config.NOT_FOUND_MARKER
+            if named and speaker.name in voice_for_name:
+                voice_map[speaker.voice_id] = voice_for_name[speaker.name]
+                continue
+            
+            voice_map[speaker.voice_id] = voice_id = next(voice_ids)
+            speaker_for_voice[voice_id] = speaker.model_copy(update={"voice_id": voice_id})
+            if named:
+                voice_for_name[speaker.name] = voice_id
+        
+        return voice_map
+    
+    def _shift_segment(self, segment: TranscriptSegment, shift: int) -> TranscriptSegment:
+        """Move a segment onto the video's timeline as HH:MM:SS:FF (timecodes that can't be parsed are kept as is)."""
+        start_frame = self._parse_timecode(segment.start_time)
+        end_frame = self._parse_timecode(segment.end_time)
+        if start_frame is None or end_frame is None:
+            return segment
+        
+        return segment.model_copy(update={
+            "start_time": frames_to_timecode(start_frame + shift),
+            "end_time": frames_to_timecode(end_frame + shift),
+        })
+    
+    def _parse_timecode(self, timecode: str) -> Optional[int]:
+        """Get a model-produced timecode as a frame count, or None if it can't be parsed."""
+        try:
+            return timecode_to_frames(timecode)
+        except ValueError:
+            return None
+    
+    def _prepare_request(
+        self,
+        video_uri: str,
+        start_offset: Optional[timedelta],
+        end_offset: Optional[timedelta],
+        fps: Optional[float],
+        model: Optional[str],
+        custom_prompt: Optional[str],
+    ) -> Tuple[str, str, str]:
+        """Validate the options and get the model, prompt and cache key for a request."""
+        self._ensure_validated()
         model = model or Config.DEFAULT_MODEL
         
         # Validate FPS
         if fps and (fps < Config.MIN_FPS or fps > Config.MAX_FPS):
             raise ValueError(f"FPS must be between {Config.MIN_FPS} and {Config.MAX_FPS}")
         
-        # Get video part
-        video_part = self.get_video_part(video_uri, start_offset, end_offset, fps)
-        if not video_part:
-            return VideoTranscription()
-        
         # Get prompt
         if custom_prompt:
             prompt = custom_prompt
@@ -230,28 +729,179 @@ class VideoTranscriber:
             timecode_format = self.get_timecode_format(end_offset - start_offset if start_offset and end_offset else None)
             prompt = self.get_transcription_prompt(timecode_format)
         
+        cache_key = TranscriptionCache.make_key(
+            video_uri=video_uri,
+            start_offset=start_offset.total_seconds() if start_offset else None,
+            end_offset=end_offset.total_seconds() if end_offset else None,
+            fps=fps,
+            model=model,
+            # Collapse whitespace so prompts that differ only in layout share an entry
+            prompt=" ".join(prompt.split()),
+        )
+        
+        return model, prompt, cache_key
+    
+    def _get_cached(self, cache_key: str) -> Optional[VideoTranscription]:
+        """Get a transcription from the persistent cache, unless it is disabled or being refreshed."""
+        if not self.cache or self.refresh_cache:
+            return None
+        
+        if (cached := self.cache.get(cache_key)) is None:
+            return None
+        
+        print(f"♻️  Using cached transcription ({cache_key[:12]})")
+        return VideoTranscription.model_validate(cached)
+    
+    def _store_cached(self, cache_key: str, transcription: VideoTranscription) -> None:
+        """Store a transcription in the persistent cache (only successful ones)."""
+        if self.cache and transcription.script_segments:
+            self.cache.set(cache_key, transcription.model_dump())
+    
+    def _claim_request(self, cache_key: str) -> Tuple[Future, bool]:
+        """
+        Register a request as in flight, coalescing identical concurrent requests into one API call.
+        
+        Returns:
+            The request's future and whether the caller owns it (and must resolve and release it)
+        """
+        with _inflight_lock:
+            pending = _inflight.get(cache_key)
+            if pending is not None:
+                print(f"⏳ Waiting for identical in-flight transcription ({cache_key[:12]})")
+                return pending, False
+            
+            pending = _inflight[cache_key] = Future()
+            return pending, True
+    
+    def _release_request(self, cache_key: str) -> None:
+        """Forget an in-flight request once its owner has resolved it."""
+        with _inflight_lock:
+            del _inflight[cache_key]
+    
+    def _build_request(
+        self,
+        video_uri: str,
+        start_offset: Optional[timedelta],
+        end_offset: Optional[timedelta],
+        fps: Optional[float],
+        model: str,
+        prompt: str,
+    ) -> Optional[Tuple[list, GenerateContentConfig]]:
+        """Get the contents and configuration for a Gemini request, or None if the video is unsupported."""
+        # Get video part
+        video_part = self.get_video_part(video_uri, start_offset, end_offset, fps)
+        if not video_part:
+            return None
+        
         # Get configuration
         config = self.get_generate_content_config(model)
         
         # Prepare contents
         contents = [video_part, prompt.strip()]
         
+        return contents, config
+    
+    def _request_transcription(
+        self,
+        video_uri: str,
+        start_offset: Optional[timedelta],
+        end_offset: Optional[timedelta],
+        fps: Optional[float],
+        model: str,
+        prompt: str,
+    ) -> VideoTranscription:
+        """Call Gemini and parse the transcription, bypassing the caches."""
+        if not (request := self._build_request(video_uri, start_offset, end_offset, fps, model, prompt)):
+            return VideoTranscription()
+        contents, config = request
+        
         print(f" {model} ".center(80, "-"))
         
-        # Make API call with retries
+        # Make API call with retries (every attempt waits out a rate-limit pause and for room in the quotas)
+        expected_tokens = self._estimate_tokens(start_offset, end_offset, fps)
         response = None
         for attempt in self.get_retrier():
             with attempt:
+                self.circuit_breaker.guard()
+                reservation = self.rate_limiter.acquire(expected_tokens)
                 response = self.client.models.generate_content(
                     model=model,
                     contents=contents,
                     config=config,
                 )
+                self.rate_limiter.record_usage(reservation, self._get_token_count(response, expected_tokens))
+                self._display_response_info(response)
+        
+        return self._parse_response(response)
+    
+    async def _request_transcription_async(
+        self,
+        video_uri: str,
+        start_offset: Optional[timedelta],
+        end_offset: Optional[timedelta],
+        fps: Optional[float],
+        model: str,
+        prompt: str,
+    ) -> VideoTranscription:
+        """Async counterpart of `_request_transcription`."""
+        if not (request := self._build_request(video_uri, start_offset, end_offset, fps, model, prompt)):
+            return VideoTranscription()
+        contents, config = request
+        
+        print(f" {model} ".center(80, "-"))
+        
+        # Make API call with retries (every attempt waits out a rate-limit pause and for room in the quotas)
+        expected_tokens = self._estimate_tokens(start_offset, end_offset, fps)
+        response = None
+        async for attempt in self.get_async_retrier():
+            with attempt:
+                await self.circuit_breaker.guard_async()
+                reservation = await self.rate_limiter.acquire_async(expected_tokens)
+                response = await self._generate_content_async(
+                    model=model,
+                    contents=contents,
+                    config=config,
+                )
+                self.rate_limiter.record_usage(reservation, self._get_token_count(response, expected_tokens))
                 self._display_response_info(response)
         
-        # Parse response
         return self._parse_response(response)
     
+    async def _generate_content_async(self, **kwargs) -> GenerateContentResponse:
+        """Call generate_content without blocking the event loop."""
+        if aio := getattr(self.client, "aio", None):
+            # Callers may run their own loops, but the shared client's calls always go through the shared one
+            future = asyncio.run_coroutine_threadsafe(aio.models.generate_content(**kwargs), _get_event_loop())
+            return await asyncio.wrap_future(future)
+        
+        # Without the SDK's async API, run the blocking call on the shared thread pool
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_blocking_executor(),
+            functools.partial(self.client.models.generate_content, **kwargs),
+        )
+    
+    def _estimate_tokens(
+        self,
+        start_offset: Optional[timedelta],
+        end_offset: Optional[timedelta],
+        fps: Optional[float],
+    ) -> int:
+        """Estimate a request's input tokens from the segment length (0 when the length is unknown)."""
+        if not end_offset:
+            return 0
+        
+        seconds = (end_offset - (start_offset or timedelta())).total_seconds()
+        per_second = Config.VIDEO_TOKENS_PER_FRAME * (fps or Config.DEFAULT_FPS) + Config.AUDIO_TOKENS_PER_SECOND
+        return max(0, int(seconds * per_second))
+    
+    def _get_token_count(self, response: GenerateContentResponse, default: int) -> int:
+        """Get the tokens a response used, for rate-limit accounting."""
+        if (usage_metadata := response.usage_metadata) and usage_metadata.total_token_count:
+            return usage_metadata.total_token_count
+        
+        return default
+    
     def _display_response_info(self, response: GenerateContentResponse) -> None:
         """Display response information."""
         if usage_metadata := response.usage_metadata:
@@ -284,6 +934,18 @@ class VideoTranscriber:
         
         return transcription
     
+    def _parse_text_response(self, response: GenerateContentResponse) -> VideoTranscription:
+        """Parse a response whose JSON was not parsed by the SDK (e.g. from a batch job)."""
+        try:
+            transcription = VideoTranscription.model_validate_json(response.text or "")
+        except pydantic.ValidationError:
+            print("Could not parse the JSON response")
+            return VideoTranscription()
+        
+        transcription.update_counts()
+        
+        return transcription
+    
     def transcribe_youtube_video(
         self,
         youtube_id: str,
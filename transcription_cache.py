@@ -0,0 +1,66 @@
+"""
+Persistent cache for transcription results.
+Stores gzip-compressed JSON in a local SQLite database so repeated runs don't re-invoke Gemini.
+"""
+
+import gzip
+import hashlib
+import json
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Optional
+
+from config import Config
+
+class TranscriptionCache:
+    """Disk-backed cache of transcription results keyed by request parameters."""
+    
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize the cache; the database is created on first use."""
+        self.cache_dir = Path(cache_dir or Config.CACHE_DIR).expanduser()
+        self.db_path = self.cache_dir / "transcriptions.sqlite3"
+        self._initialized = False
+    
+    @staticmethod
+    def make_key(**params) -> str:
+        """Get a stable SHA-256 key for the given request parameters."""
+        payload = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the cache table on first use."""
+        if not self._initialized:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        if not self._initialized:
+            conn.execute("CREATE TABLE IF NOT EXISTS transcriptions (key TEXT PRIMARY KEY, data BLOB NOT NULL)")
+            conn.commit()
+            self._initialized = True
+        
+        return conn
+    
+    def get(self, key: str) -> Optional[dict]:
+        """Get a cached transcription dump, or None on a miss."""
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute("SELECT data FROM transcriptions WHERE key = ?", (key,)).fetchone()
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️  Transcription cache unavailable: {e}")
+            return None
+        
+        if row is None:
+            return None
+        
+        return json.loads(gzip.decompress(row[0]))
+    
+    def set(self, key: str, data: dict) -> None:
+        """Store a transcription dump under the given key."""
+        blob = gzip.compress(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute("INSERT OR REPLACE INTO transcriptions (key, data) VALUES (?, ?)", (key, blob))
+                conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️  Could not write transcription cache: {e}")
@@ -2,8 +2,10 @@
 Visualization module for displaying transcription results.
 """
 
-import itertools
-from typing import Dict, List
+import csv
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 from pandas.io.formats.style import Styler
@@ -12,11 +14,35 @@ from pandas.io.formats.style_render import CSSDict
 from config import Config
 from models import VideoTranscription, Speaker, TranscriptSegment
 
+# CSV export columns
+SEGMENT_CSV_HEADERS = (
+    "start_time",
+    "end_time",
+    "speaker_name",
+    "speaker_company",
+    "speaker_position",
+    "text",
+    "voice_id",
+    "emotion",
+    "tone",
+    "energy_level",
+    "speech_rate",
+)
+SPEAKER_CSV_HEADERS = ("voice_id", "name", "company", "position", "role_in_video")
+TRANSLATION_CSV_HEADERS = ("line_number", "speaker", "source_iso", "target_iso")
+CSV_WRITE_BUFFER_SIZE = 1 << 16
+
 class TranscriptionVisualizer:
     """Visualizer for transcription results."""
     
-    def __init__(self):
-        """Initialize the visualizer."""
+    def __init__(self, html_mode: bool = False):
+        """
+        Initialize the visualizer.
+        
+        Args:
+            html_mode: Display tables as styled HTML in a notebook (requires IPython) instead of plain text
+        """
+        self.html_mode = html_mode
         self.bgcolor_column = "bg_color"  # Hidden column for row colors
         
         # Color palettes for speakers
@@ -34,18 +60,16 @@ class TranscriptionVisualizer:
     
     def get_color_for_voice_mapping(self, speakers: List[Speaker]) -> Dict[int, str]:
         """Get color mapping for voice IDs."""
-        known_colors = itertools.cycle(self.known_speaker_colors)
-        unknown_colors = itertools.cycle(self.unknown_speaker_colors)
+        known = np.array(self.known_speaker_colors)
+        unknown = np.array(self.unknown_speaker_colors)
         
-        mapping: Dict[int, str] = {}
-        for speaker in speakers:
-            if speaker.name != Config.NOT_FOUND_MARKER:
-                color = next(known_colors)
-            else:
-                color = next(unknown_colors)
-            mapping[speaker.voice_id] = color
+        # Known and unknown speakers each cycle through their own palette in speaker order
+        is_known = np.array([speaker.name != Config.NOT_FOUND_MARKER for speaker in speakers], dtype=bool)
+        known_index = (np.cumsum(is_known) - 1) % len(known)
+        unknown_index = (np.cumsum(~is_known) - 1) % len(unknown)
+        colors = np.where(is_known, known[known_index], unknown[unknown_index])
         
-        return mapping
+        return dict(zip((speaker.voice_id for speaker in speakers), colors.tolist()))
     
     def get_table_styler(self, df: DataFrame) -> Styler:
         """Get styled table for display."""
@@ -77,107 +101,107 @@ class TranscriptionVisualizer:
         style = f"background-color:{row[self.bgcolor_column]}"
         return [style] * len(row)
     
-    def display_speakers(self, transcription: VideoTranscription) -> None:
-        """Display speakers table."""
-        def sanitize_field(s: str, symbol_if_unknown: str) -> str:
-            return symbol_if_unknown if s == Config.NOT_FOUND_MARKER else s
-        
-        def yield_rows():
-            yield ["voice_id", "name", "company", "position", "role_in_video", self.bgcolor_column]
-            
-            color_for_voice = self.get_color_for_voice_mapping(transcription.speakers)
-            for speaker in transcription.speakers:
-                yield [
-                    str(speaker.voice_id),
-                    sanitize_field(speaker.name, Config.NOT_FOUND_MARKER),
-                    sanitize_field(speaker.company, Config.NOT_FOUND_MARKER),
-                    sanitize_field(speaker.position, Config.NOT_FOUND_MARKER),
-                    sanitize_field(speaker.role_in_video, Config.NOT_FOUND_MARKER),
-                    color_for_voice.get(speaker.voice_id, "red"),
-                ]
+    def _render(self, df: DataFrame) -> None:
+        """Print a table, or display it styled in a notebook in HTML mode."""
+        if not self.html_mode:
+            # Plain text can't show row colors, so skip the styler entirely
+            print(df.drop(columns=[self.bgcolor_column], errors="ignore").to_string(index=False))
+            return
         
-        data = list(yield_rows())
-        df = DataFrame(columns=data[0], data=data[1:])
         styler = self.get_table_styler(df)
-        styler.apply(self.change_row_bgcolor, axis=1)
-        styler.hide([self.bgcolor_column], axis="columns")
+        if self.bgcolor_column in df.columns:
+            styler.apply(self.change_row_bgcolor, axis=1)
+            styler.hide([self.bgcolor_column], axis="columns")
+        
+        # Imported lazily since IPython only ships with notebook environments
+        from IPython.display import display
+        display(styler)
+    
+    def display_speakers(
+        self,
+        transcription: VideoTranscription,
+        color_for_voice: Optional[Dict[int, str]] = None,
+    ) -> None:
+        """Display speakers table (pass `color_for_voice` to reuse a precomputed color mapping)."""
+        speakers = transcription.speakers
+        if color_for_voice is None:
+            color_for_voice = self.get_color_for_voice_mapping(speakers)
+        
+        # Explicit dtypes spare pandas from inferring them
+        df = DataFrame({
+            "voice_id": pd.Categorical([str(speaker.voice_id) for speaker in speakers]),
+            "name": pd.array([speaker.name for speaker in speakers], dtype="string"),
+            "company": pd.array([speaker.company for speaker in speakers], dtype="string"),
+            "position": pd.array([speaker.position for speaker in speakers], dtype="string"),
+            "role_in_video": pd.array([speaker.role_in_video for speaker in speakers], dtype="string"),
+            self.bgcolor_column: pd.Categorical([color_for_voice.get(speaker.voice_id, "red") for speaker in speakers]),
+        })
         
         print(f"\n### Speakers ({len(transcription.speakers)})")
-        print(styler.to_string())
+        self._render(df)
     
-    def display_script_segments(self, transcription: VideoTranscription) -> None:
-        """Display script segments table."""
-        def yield_rows():
-            yield ["start_time", "end_time", "speaker", "emotion", "tone", "energy", "rate", "text", self.bgcolor_column]
-            
+    def get_speaker_label(self, speaker: Optional[Speaker], voice_id: int) -> str:
+        """Get the label shown for a voice in the script table."""
+        if speaker:
+            if speaker.name != Config.NOT_FOUND_MARKER:
+                return speaker.name
+            if speaker.position != Config.NOT_FOUND_MARKER:
+                return f"[voice {voice_id}][{speaker.position}]"
+            if speaker.role_in_video != Config.NOT_FOUND_MARKER:
+                return f"[voice {voice_id}][{speaker.role_in_video}]"
+        
+        return f"[voice {voice_id}]"
+    
+    def display_script_segments(
+        self,
+        transcription: VideoTranscription,
+        color_for_voice: Optional[Dict[int, str]] = None,
+    ) -> None:
+        """Display script segments table (pass `color_for_voice` to reuse a precomputed color mapping)."""
+        segments = transcription.script_segments
+        if color_for_voice is None:
             color_for_voice = self.get_color_for_voice_mapping(transcription.speakers)
-            speaker_for_voice = {
-                speaker.voice_id: speaker for speaker in transcription.speakers
-            }
-            previous_voice = None
-            
-            for segment in transcription.script_segments:
-                current_voice = segment.voice_id
-                speaker_label = ""
-                
-                if speaker := speaker_for_voice.get(current_voice):
-                    if speaker.name != Config.NOT_FOUND_MARKER:
-                        speaker_label = speaker.name
-                    elif speaker.position != Config.NOT_FOUND_MARKER:
-                        speaker_label = f"[voice {current_voice}][{speaker.position}]"
-                    elif speaker.role_in_video != Config.NOT_FOUND_MARKER:
-                        speaker_label = f"[voice {current_voice}][{speaker.role_in_video}]"
-                
-                if not speaker_label:
-                    speaker_label = f"[voice {current_voice}]"
-                
-                # Use quote mark for consecutive segments from same speaker
-                display_speaker = speaker_label if current_voice != previous_voice else '"'
-                
-                yield [
-                    segment.start_time,
-                    segment.end_time,
-                    display_speaker,
-                    segment.emotion or "-",
-                    segment.tone or "-",
-                    segment.energy_level or "-",
-                    segment.speech_rate or "-",
-                    segment.text,
-                    color_for_voice.get(current_voice, "red"),
-                ]
-                previous_voice = current_voice
+        speaker_for_voice = transcription.speaker_by_voice_id
         
-        data = list(yield_rows())
-        df = DataFrame(columns=data[0], data=data[1:])
-        styler = self.get_table_styler(df)
-        styler.apply(self.change_row_bgcolor, axis=1)
-        styler.hide([self.bgcolor_column], axis="columns")
+        # Labels and colors are resolved once per voice, then mapped over the column
+        voice_ids = pd.Series([segment.voice_id for segment in segments], dtype="int64")
+        label_for_voice = {vid: self.get_speaker_label(speaker_for_voice.get(vid), vid) for vid in voice_ids.unique()}
+        speaker_labels = voice_ids.map(label_for_voice)
+        
+        # Use quote mark for consecutive segments from same speaker
+        display_speakers = speaker_labels.where(voice_ids.ne(voice_ids.shift()), '"')
+        
+        # Explicit dtypes spare pandas from inferring them; repeated labels and colors are categorical
+        df = DataFrame({
+            "start_time": pd.array([segment.start_time for segment in segments], dtype="string"),
+            "end_time": pd.array([segment.end_time for segment in segments], dtype="string"),
+            "speaker": pd.Categorical(display_speakers.to_numpy(dtype=object)),
+            "emotion": pd.array([segment.emotion or "-" for segment in segments], dtype="string"),
+            "tone": pd.array([segment.tone or "-" for segment in segments], dtype="string"),
+            "energy": pd.array([segment.energy_level or "-" for segment in segments], dtype="string"),
+            "rate": pd.array([segment.speech_rate or "-" for segment in segments], dtype="string"),
+            "text": pd.array([segment.text for segment in segments], dtype="string"),
+            self.bgcolor_column: pd.Categorical(voice_ids.map(color_for_voice).fillna("red").to_numpy(dtype=object)),
+        })
         
         print(f"\n### Script Segments ({len(transcription.script_segments)})")
-        print(styler.to_string())
+        self._render(df)
     
     def display_translation_table(self, transcription: VideoTranscription) -> None:
         """Display translation table."""
         if not transcription.translation_table:
             return
         
-        def yield_rows():
-            yield ["line_number", "speaker", "source_iso", "target_iso"]
-            
-            for translation in transcription.translation_table:
-                yield [
-                    str(translation.line_number),
-                    translation.speaker,
-                    translation.source_iso,
-                    translation.target_iso,
-                ]
-        
-        data = list(yield_rows())
-        df = DataFrame(columns=data[0], data=data[1:])
-        styler = self.get_table_styler(df)
+        translations = transcription.translation_table
+        df = DataFrame({
+            "line_number": pd.array([str(translation.line_number) for translation in translations], dtype="string"),
+            "speaker": pd.Categorical([translation.speaker for translation in translations]),
+            "source_iso": pd.array([translation.source_iso for translation in translations], dtype="string"),
+            "target_iso": pd.array([translation.target_iso for translation in translations], dtype="string"),
+        })
         
         print(f"\n### Translation Table ({len(transcription.translation_table)})")
-        print(styler.to_string())
+        self._render(df)
     
     def display_summary(self, transcription: VideoTranscription) -> None:
         """Display transcription summary."""
@@ -205,64 +229,128 @@ class TranscriptionVisualizer:
     
     def display_full_transcription(self, transcription: VideoTranscription) -> None:
         """Display complete transcription with all components."""
+        # Both tables color rows by voice, so compute the mapping once
+        color_for_voice = self.get_color_for_voice_mapping(transcription.speakers)
+        
         self.display_summary(transcription)
-        self.display_speakers(transcription)
-        self.display_script_segments(transcription)
+        self.display_speakers(transcription, color_for_voice)
+        self.display_script_segments(transcription, color_for_voice)
         self.display_translation_table(transcription)
     
     def export_to_csv(self, transcription: VideoTranscription, base_filename: str) -> None:
         """Export transcription to CSV files."""
-        # Export script segments
-        segments_data = []
-        for segment in transcription.script_segments:
-            speaker = transcription.get_speaker_by_voice_id(segment.voice_id)
-            segments_data.append({
-                "start_time": segment.start_time,
-                "end_time": segment.end_time,
-                "speaker_name": speaker.name if speaker else Config.NOT_FOUND_MARKER,
-                "speaker_company": speaker.company if speaker else Config.NOT_FOUND_MARKER,
-                "speaker_position": speaker.position if speaker else Config.NOT_FOUND_MARKER,
-                "text": segment.text,
-                "voice_id": segment.voice_id,
-                "emotion": segment.emotion or "",
-                "tone": segment.tone or "",
-                "energy_level": segment.energy_level or "",
-                "speech_rate": segment.speech_rate or "",
-            })
-        
-        segments_df = pd.DataFrame(segments_data)
-        segments_df.to_csv(f"{base_filename}_segments.csv", index=False)
-        
-        # Export speakers
-        speakers_data = []
-        for speaker in transcription.speakers:
-            speakers_data.append({
-                "voice_id": speaker.voice_id,
-                "name": speaker.name,
-                "company": speaker.company,
-                "position": speaker.position,
-                "role_in_video": speaker.role_in_video,
-            })
-        
-        speakers_df = pd.DataFrame(speakers_data)
-        speakers_df.to_csv(f"{base_filename}_speakers.csv", index=False)
-        
-        # Export translation table if available
-        if transcription.translation_table:
-            translation_data = []
-            for translation in transcription.translation_table:
-                translation_data.append({
-                    "line_number": translation.line_number,
-                    "speaker": translation.speaker,
-                    "source_iso": translation.source_iso,
-                    "target_iso": translation.target_iso,
-                })
+        # The files are independent, so write them in parallel to overlap their disk I/O
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                # Export script segments
+                executor.submit(
+                    self._write_csv,
+                    f"{base_filename}_segments.csv",
+                    SEGMENT_CSV_HEADERS,
+                    self._get_segment_rows(transcription),
+                ),
+                # Export speakers
+                executor.submit(
+                    self._write_csv,
+                    f"{base_filename}_speakers.csv",
+                    SPEAKER_CSV_HEADERS,
+                    self._get_speaker_rows(transcription),
+                ),
+            ]
             
-            translation_df = pd.DataFrame(translation_data)
-            translation_df.to_csv(f"{base_filename}_translations.csv", index=False)
+            # Export translation table if available
+            if transcription.translation_table:
+                futures.append(executor.submit(
+                    self._write_csv,
+                    f"{base_filename}_translations.csv",
+                    TRANSLATION_CSV_HEADERS,
+                    self._get_translation_rows(transcription),
+                ))
+            
+            # Surface any write error
+            for future in futures:
+                future.result()
         
         print(f"\n✅ Exported transcription to:")
         print(f"   📄 {base_filename}_segments.csv")
         print(f"   📄 {base_filename}_speakers.csv")
         if transcription.translation_table:
             print(f"   📄 {base_filename}_translations.csv")
+    
+    def export_to_parquet(self, transcription: VideoTranscription, base_filename: str) -> None:
+        """Export transcription to zstd-compressed Parquet files (requires pyarrow)."""
+        tables = [
+            ("segments", SEGMENT_CSV_HEADERS, self._get_segment_rows(transcription)),
+            ("speakers", SPEAKER_CSV_HEADERS, self._get_speaker_rows(transcription)),
+        ]
+        if transcription.translation_table:
+            tables.append(("translations", TRANSLATION_CSV_HEADERS, self._get_translation_rows(transcription)))
+        
+        filenames = []
+        for name, headers, rows in tables:
+            filename = f"{base_filename}_{name}.parquet"
+            df = DataFrame.from_records(list(rows), columns=list(headers))
+            df.to_parquet(filename, engine="pyarrow", compression="zstd", index=False)
+            filenames.append(filename)
+        
+        print(f"\n✅ Exported transcription to:")
+        for filename in filenames:
+            print(f"   📄 {filename}")
+    
+    def export_to_json(self, transcription: VideoTranscription, filename: str) -> None:
+        """Export transcription to a JSON file, streaming one script segment at a time."""
+        # Everything but the segments is small, so serialize it in one go
+        other_fields = transcription.model_dump_json(exclude={"script_segments"})
+        
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write('{"script_segments": [')
+            for i, segment in enumerate(transcription.script_segments):
+                f.write(("," if i else "") + "\n  " + segment.model_dump_json())
+            f.write("\n], " + other_fields[1:] + "\n")
+        
+        print(f"✅ Exported JSON to: {filename}")
+    
+    def _get_segment_rows(self, transcription: VideoTranscription) -> Iterator[tuple]:
+        """Get the script segment export rows, with speaker details joined in by voice ID."""
+        missing = (Config.NOT_FOUND_MARKER,) * 3
+        speaker_info = {
+            voice_id: (speaker.name, speaker.company, speaker.position)
+            for voice_id, speaker in transcription.speaker_by_voice_id.items()
+        }
+        
+        return (
+            (
+                segment.start_time,
+                segment.end_time,
+                *speaker_info.get(segment.voice_id, missing),
+                segment.text,
+                segment.voice_id,
+                segment.emotion or "",
+                segment.tone or "",
+                segment.energy_level or "",
+                segment.speech_rate or "",
+            )
+            for segment in transcription.script_segments
+        )
+    
+    def _get_speaker_rows(self, transcription: VideoTranscription) -> Iterator[tuple]:
+        """Get the speaker export rows."""
+        return (
+            (speaker.voice_id, speaker.name, speaker.company, speaker.position, speaker.role_in_video)
+            for speaker in transcription.speakers
+        )
+    
+    def _get_translation_rows(self, transcription: VideoTranscription) -> Iterator[tuple]:
+        """Get the translation table export rows."""
+        return (
+            (translation.line_number, translation.speaker, translation.source_iso, translation.target_iso)
+            for translation in transcription.translation_table
+        )
+    
+    def _write_csv(self, filename: str, headers: Tuple[str, ...], rows: Iterable[tuple]) -> None:
+        """Write a header and rows to a CSV file in one writerows pass."""
+        # A 64 KB buffer keeps rows streaming to disk in few large writes
+        with open(filename, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(headers)
+            writer.writerows(rows)